@@ -10,16 +10,26 @@ Use:
 from __future__ import annotations
 
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "src"))
 
-from api.main import app  # noqa: E402
+from api.config import get_settings  # noqa: E402
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="127.0.0.1", port=8000)
-
-
+    settings = get_settings()
+    # uvloop/httptools ship with uvicorn[standard]; uvloop is unavailable on Windows.
+    uvicorn.run(
+        # Import string so worker processes can re-import the app.
+        "api.main:app",
+        host=settings.host,
+        port=settings.port,
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        workers=settings.workers,
+        access_log=settings.access_log,
+    )
@@ -31,8 +31,13 @@ setup(
         "click>=8.1.0",
         "fastapi>=0.115.0",
         "uvicorn[standard]>=0.30.0",
+        "pydantic>=2.7.0",
         "pydantic-settings>=2.5.0",
+        "orjson>=3.9.0",
     ],
+    extras_require={
+        "speedups": ["pybase64>=1.3.0"],
+    },
     entry_points={
         "console_scripts": [
             "telegram-automation-api=api.main:app",
@@ -6,6 +6,10 @@ cleanly (local dev, Windows service, container, etc.).
 
 from __future__ import annotations
 
+from functools import cached_property, lru_cache
+from typing import Annotated
+
+from fastapi import Depends
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,17 +24,36 @@ class Settings(BaseSettings):
 
     host: str = Field(default="127.0.0.1", description="Bind host for uvicorn")
     port: int = Field(default=8000, description="Bind port for uvicorn")
+    # Login jobs live in process memory, so >1 worker needs sticky routing per job_id.
+    workers: int = Field(default=1, description="Number of uvicorn worker processes")
+    access_log: bool = Field(default=False, description="Emit one uvicorn access log line per request")
 
     # Browser defaults used by API if caller doesn't specify.
     default_headless: bool = Field(default=True, description="Default headless mode for automation")
     use_enhanced_browser: bool = Field(default=True, description="Use EnhancedBrowserAdapter by default")
+    max_concurrent_logins: int = Field(default=2, description="Login jobs allowed to launch browsers at once")
+    job_ttl_seconds: float = Field(default=3600.0, description="How long finished login jobs stay queryable")
+
+    # Warm browsers reused by /contacts and /groups (see services.browser_runner.BrowserPool).
+    browser_pool_size: int = Field(default=1, description="Idle browsers kept per session; 0 disables reuse")
+    browser_pool_idle_ttl: float = Field(default=300.0, description="Seconds an idle pooled browser is kept")
+    browser_pool_prewarm: bool = Field(default=False, description="Launch browsers for saved sessions at startup")
+    group_list_ttl: float = Field(default=10.0, description="Seconds /groups/list reuses a session's last result; 0 disables")
 
     # CORS (optional). Set to '*' for dev, a list of origins for production.
     cors_allow_origins: str = Field(default="*", description="Comma-separated list of allowed CORS origins")
 
+    @cached_property
+    def cors_origins(self) -> list[str]:
+        """`cors_allow_origins` parsed once; falls back to `["*"]` when empty."""
+        origins = [o.strip() for o in self.cors_allow_origins.split(",") if o.strip()]
+        return origins or ["*"]
+
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     # cached singleton is fine for process-level config
     return Settings()
 
 
+SettingsDep = Annotated[Settings, Depends(get_settings)]
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from importlib import metadata
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from telegram_bot.browser import shutdown_shared_browsers
 
 from .config import get_settings
 from .routes.auth import router as auth_router
@@ -15,27 +21,63 @@ from .routes.groups import router as groups_router
 from .routes.notes import router as notes_router
 from .routes.runs import router as runs_router
 from .routes.sessions import router as sessions_router
+from .services.browser_runner import get_browser_pool, prewarm_browser_pool
+from .services.job_manager import get_job_manager
 
 logger = logging.getLogger(__name__)
 
 
+def _get_version() -> str:
+    # Best-effort. When running from source without an installed package, fallback.
+    try:
+        return metadata.version("telegram-automation")
+    except Exception:
+        return "0.0.0"
+
+
+# importlib.metadata scans sys.path; the installed version can't change while we run.
+_VERSION = _get_version()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    if settings.browser_pool_prewarm:
+        await prewarm_browser_pool(
+            headless=settings.default_headless,
+            use_enhanced_browser=settings.use_enhanced_browser,
+        )
+    yield
+    await get_job_manager().close()
+    await get_browser_pool().close()
+    await shutdown_shared_browsers()
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
+    # No interactive docs in prod: skips building and holding the OpenAPI schema.
+    docs_enabled = settings.environment != "prod"
 
     app = FastAPI(
         title="Telegram Automation API",
         description="Server API for automating Telegram Web operations (Playwright).",
-        version=_get_version(),
+        version=_VERSION,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None,
+        openapi_url="/openapi.json" if docs_enabled else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    allow_origins = [o.strip() for o in settings.cors_allow_origins.split(",") if o.strip()]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=allow_origins if allow_origins else ["*"],
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Added last so it wraps CORS: run data and notes lists can be large.
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
     @app.get("/health")
     async def health() -> dict[str, str]:
@@ -43,7 +85,7 @@ def create_app() -> FastAPI:
 
     @app.get("/version")
     async def version() -> dict[str, str]:
-        return {"version": _get_version()}
+        return {"version": _VERSION}
 
     app.include_router(auth_router)
     app.include_router(sessions_router)
@@ -55,14 +97,4 @@ def create_app() -> FastAPI:
     return app
 
 
-def _get_version() -> str:
-    # Best-effort. When running from source without an installed package, fallback.
-    try:
-        return metadata.version("telegram-automation")
-    except Exception:
-        return "0.0.0"
-
-
 app = create_app()
-
-
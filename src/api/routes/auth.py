@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
-from ..config import get_settings
+from ..config import SettingsDep
 from ..schemas.auth import (
     AuthStartRequest,
     AuthStartResponse,
@@ -12,16 +12,15 @@ from ..schemas.auth import (
     AuthSubmit2FARequest,
     AuthSubmitOtpRequest,
 )
-from ..services.job_manager import JobManager
+from ..services.job_manager import get_job_manager
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-_jobs = JobManager()
+_jobs = get_job_manager()
 
 
 @router.post("/start", response_model=AuthStartResponse)
-async def start(req: AuthStartRequest) -> AuthStartResponse:
-    settings = get_settings()
+async def start(req: AuthStartRequest, settings: SettingsDep) -> AuthStartResponse:
     headless = req.headless if req.headless is not None else settings.default_headless
 
     job = await _jobs.create_login_job(
@@ -36,30 +35,25 @@ async def start(req: AuthStartRequest) -> AuthStartResponse:
 
 
 @router.get("/status/{job_id}", response_model=AuthStatusResponse)
-async def status(job_id: str) -> AuthStatusResponse:
+async def status(
+    job_id: str,
+    wait: float = Query(
+        default=0, ge=0, le=60, description="Seconds to wait for a status change while the job is queued/running"
+    ),
+) -> AuthStatusResponse:
     job = await _jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="job_not_found")
-    return AuthStatusResponse(
-        job_id=job.job_id,
-        status=job.status,
-        phone=job.phone,
-        run_name=job.run_name,
-        error=job.error,
-    )
+    if wait and job.status in ("queued", "running"):
+        await _jobs.await_status_change(job_id, wait)
+    return AuthStatusResponse(**job.to_dict())
 
 
 @router.post("/submit-otp", response_model=AuthStatusResponse)
 async def submit_otp(req: AuthSubmitOtpRequest) -> AuthStatusResponse:
     try:
         job = await _jobs.submit_otp(req.job_id, req.otp)
-        return AuthStatusResponse(
-            job_id=job.job_id,
-            status=job.status,
-            phone=job.phone,
-            run_name=job.run_name,
-            error=job.error,
-        )
+        return AuthStatusResponse(**job.to_dict())
     except KeyError:
         raise HTTPException(status_code=404, detail="job_not_found")
     except ValueError as e:
@@ -72,13 +66,7 @@ async def submit_otp(req: AuthSubmitOtpRequest) -> AuthStatusResponse:
 async def submit_2fa(req: AuthSubmit2FARequest) -> AuthStatusResponse:
     try:
         job = await _jobs.submit_2fa(req.job_id, req.password)
-        return AuthStatusResponse(
-            job_id=job.job_id,
-            status=job.status,
-            phone=job.phone,
-            run_name=job.run_name,
-            error=job.error,
-        )
+        return AuthStatusResponse(**job.to_dict())
     except KeyError:
         raise HTTPException(status_code=404, detail="job_not_found")
     except ValueError as e:
@@ -7,42 +7,52 @@ from fastapi import APIRouter, HTTPException
 from telegram_bot.contacts import ContactManager
 from telegram_bot.utils import extract_phone_number
 
-from ..config import get_settings
+from ..config import SettingsDep
 from ..schemas.contacts import (
     AddContactRequest,
     AddContactResponse,
     CheckPhoneRequest,
     CheckPhoneResponse,
 )
-from ..services.browser_runner import browser_with_session
+from ..services.batching import BatchingDispatcher
+from ..services.browser_runner import PoolKey, browser_with_session
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
-@router.post("/check-phone", response_model=CheckPhoneResponse)
-async def check_phone(req: CheckPhoneRequest) -> CheckPhoneResponse:
-    settings = get_settings()
+async def _check_phones(key: PoolKey, phones: list[str]) -> list[bool | Exception]:
+    async with browser_with_session(**key._asdict()) as browser:
+        mgr = ContactManager(browser)
+        results: list[bool | Exception] = []
+        for phone in phones:
+            try:
+                results.append(await mgr.check_phone_exists(phone))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+_check_phone_batches = BatchingDispatcher(_check_phones)
+
+
+@router.post("/check-phone", response_model=None, responses={200: {"model": CheckPhoneResponse}})
+async def check_phone(req: CheckPhoneRequest, settings: SettingsDep) -> dict[str, bool]:
     headless = req.headless if req.headless is not None else settings.default_headless
 
+    key = PoolKey(
+        extract_phone_number(req.session_phone), headless, req.proxy, settings.use_enhanced_browser
+    )
     try:
-        async with browser_with_session(
-            session_phone=req.session_phone,
-            headless=headless,
-            proxy=req.proxy,
-            use_enhanced_browser=settings.use_enhanced_browser,
-        ) as browser:
-            mgr = ContactManager(browser)
-            exists = await mgr.check_phone_exists(extract_phone_number(req.phone))
-            return CheckPhoneResponse(exists=exists)
+        exists = await _check_phone_batches.submit(key, extract_phone_number(req.phone))
+        return {"exists": exists}
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="session_not_found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/add", response_model=AddContactResponse)
-async def add_contact(req: AddContactRequest) -> AddContactResponse:
-    settings = get_settings()
+@router.post("/add", response_model=None, responses={200: {"model": AddContactResponse}})
+async def add_contact(req: AddContactRequest, settings: SettingsDep) -> dict[str, bool]:
     headless = req.headless if req.headless is not None else settings.default_headless
 
     try:
@@ -58,7 +68,7 @@ async def add_contact(req: AddContactRequest) -> AddContactResponse:
                 req.first_name,
                 (req.last_name or "").strip(),
             )
-            return AddContactResponse(success=ok)
+            return {"success": ok}
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="session_not_found")
     except Exception as e:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from telegram_bot.groups import GroupManager
+from telegram_bot.utils import extract_phone_number
 
-from ..config import get_settings
+from ..config import SettingsDep
 from ..schemas.groups import (
     AddMembersRequest,
     AddMembersResponse,
@@ -15,14 +17,31 @@ from ..schemas.groups import (
     GroupInfoResponse,
     ListGroupsResponse,
 )
-from ..services.browser_runner import browser_with_session
+from ..services.batching import BatchingDispatcher
+from ..services.browser_runner import PoolKey, browser_with_session, get_browser_pool
 
 router = APIRouter(prefix="/groups", tags=["groups"])
 
 
-@router.post("/create", response_model=CreateGroupResponse)
-async def create_group(req: CreateGroupRequest) -> CreateGroupResponse:
-    settings = get_settings()
+async def _add_members(
+    key: PoolKey, requests: list[tuple[str, list[str]]]
+) -> list[bool | Exception]:
+    async with browser_with_session(**key._asdict()) as browser:
+        mgr = GroupManager(browser)
+        results: list[bool | Exception] = []
+        for group_name, phones in requests:
+            try:
+                results.append(await mgr.add_members_to_group(group_name, phones))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+_add_members_batches = BatchingDispatcher(_add_members)
+
+
+@router.post("/create", response_model=None, responses={200: {"model": CreateGroupResponse}})
+async def create_group(req: CreateGroupRequest, settings: SettingsDep) -> dict[str, bool]:
     headless = req.headless if req.headless is not None else settings.default_headless
     try:
         async with browser_with_session(
@@ -32,52 +51,59 @@ async def create_group(req: CreateGroupRequest) -> CreateGroupResponse:
             use_enhanced_browser=settings.use_enhanced_browser,
         ) as browser:
             mgr = GroupManager(browser)
-            ok = await mgr.create_group(req.name, req.members)
-            return CreateGroupResponse(success=ok)
+            try:
+                ok = await mgr.create_group(req.name, req.members)
+            finally:
+                get_browser_pool().invalidate_group_list(extract_phone_number(req.session_phone))
+            return {"success": ok}
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="session_not_found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/add-members", response_model=AddMembersResponse)
-async def add_members(req: AddMembersRequest) -> AddMembersResponse:
-    settings = get_settings()
+@router.post("/add-members", response_model=None, responses={200: {"model": AddMembersResponse}})
+async def add_members(req: AddMembersRequest, settings: SettingsDep) -> dict[str, bool]:
     headless = req.headless if req.headless is not None else settings.default_headless
+    key = PoolKey(
+        extract_phone_number(req.session_phone), headless, req.proxy, settings.use_enhanced_browser
+    )
     try:
-        async with browser_with_session(
-            session_phone=req.session_phone,
-            headless=headless,
-            proxy=req.proxy,
-            use_enhanced_browser=settings.use_enhanced_browser,
-        ) as browser:
-            mgr = GroupManager(browser)
-            ok = await mgr.add_members_to_group(req.group_name, req.phones)
-            return AddMembersResponse(success=ok)
+        ok = await _add_members_batches.submit(key, (req.group_name, req.phones))
+        return {"success": ok}
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="session_not_found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/list", response_model=ListGroupsResponse)
+@router.get("/list", responses={200: {"model": ListGroupsResponse}})
 async def list_groups(
+    settings: SettingsDep,
     session_phone: str = Query(..., description="Phone number of a logged-in session to use"),
     headless: bool | None = Query(default=None),
     proxy: str | None = Query(default=None),
-) -> ListGroupsResponse:
-    settings = get_settings()
+) -> Response:
     resolved_headless = headless if headless is not None else settings.default_headless
+    pool = get_browser_pool()
+    phone = extract_phone_number(session_phone)
+    # A recent result for this session skips checking out a browser altogether.
+    groups = pool.cached_group_list(phone)
+    if groups is not None:
+        return Response(orjson.dumps({"groups": groups}), media_type="application/json")
     try:
         async with browser_with_session(
-            session_phone=session_phone,
+            session_phone=phone,
             headless=resolved_headless,
             proxy=proxy,
             use_enhanced_browser=settings.use_enhanced_browser,
         ) as browser:
             mgr = GroupManager(browser)
             groups = await mgr.list_groups()
-            return ListGroupsResponse(groups=groups)
+            # list_groups() returns [] when the sidebar could not be read; don't pin that.
+            if groups:
+                pool.store_group_list(phone, groups)
+            return Response(orjson.dumps({"groups": groups}), media_type="application/json")
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="session_not_found")
     except Exception as e:
@@ -86,12 +112,12 @@ async def list_groups(
 
 @router.get("/info", response_model=GroupInfoResponse)
 async def group_info(
+    settings: SettingsDep,
     session_phone: str = Query(...),
     group_name: str = Query(...),
     headless: bool | None = Query(default=None),
     proxy: str | None = Query(default=None),
 ) -> GroupInfoResponse:
-    settings = get_settings()
     resolved_headless = headless if headless is not None else settings.default_headless
     try:
         async with browser_with_session(
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from telegram_bot.notes import NotesManager
 
@@ -19,36 +23,58 @@ from ..schemas.notes import (
 router = APIRouter(prefix="/notes", tags=["notes"])
 
 
-@router.post("", response_model=NoteCreateResponse)
-async def create_note(req: NoteCreateRequest) -> NoteCreateResponse:
-    mgr = NotesManager()
-    note_id = mgr.create_note(req.title, req.content, req.category, req.tags, req.priority)
-    return NoteCreateResponse(note_id=note_id)
+@lru_cache(maxsize=1)
+def get_notes_manager() -> NotesManager:
+    # One manager per process: all requests share its SQLite connection.
+    return NotesManager()
+
 
+@router.post("", response_model=None, responses={200: {"model": NoteCreateResponse}})
+async def create_note(
+    req: NoteCreateRequest, mgr: NotesManager = Depends(get_notes_manager)
+) -> dict[str, str]:
+    # SQLite calls run in a worker thread so a slow disk never stalls the event loop.
+    note_id = await asyncio.to_thread(
+        mgr.create_note, req.title, req.content, req.category, req.tags, req.priority
+    )
+    return {"note_id": note_id}
 
-@router.get("", response_model=NotesListResponse)
+
+@router.get("", responses={200: {"model": NotesListResponse}})
 async def list_notes(
     category: str | None = Query(default=None),
     tags: str | None = Query(default=None, description="Comma-separated tags"),
     priority: str | None = Query(default=None),
     search: str | None = Query(default=None),
-) -> NotesListResponse:
-    mgr = NotesManager()
+    limit: int | None = Query(default=None, ge=1, description="Maximum number of notes to return"),
+    offset: int = Query(default=0, ge=0, description="Number of notes to skip, newest first"),
+    mgr: NotesManager = Depends(get_notes_manager),
+) -> Response:
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
-    notes = mgr.list_notes(category=category, tags=tag_list, priority=priority, search=search)
-    return NotesListResponse(notes=notes)
+    notes = await asyncio.to_thread(
+        mgr.list_notes,
+        category=category,
+        tags=tag_list,
+        priority=priority,
+        search=search,
+        limit=limit,
+        offset=offset,
+    )
+    # Notes are plain JSON dicts already; serialize once instead of validating every item.
+    return Response(orjson.dumps({"notes": notes}), media_type="application/json")
 
 
 @router.get("/{note_id}", response_model=NoteGetResponse)
-async def get_note(note_id: str) -> NoteGetResponse:
-    mgr = NotesManager()
-    return NoteGetResponse(note=mgr.get_note(note_id))
+async def get_note(note_id: str, mgr: NotesManager = Depends(get_notes_manager)) -> NoteGetResponse:
+    return NoteGetResponse(note=await asyncio.to_thread(mgr.get_note, note_id))
 
 
 @router.patch("/{note_id}", response_model=NoteUpdateResponse)
-async def update_note(note_id: str, req: NoteUpdateRequest) -> NoteUpdateResponse:
-    mgr = NotesManager()
-    updated = mgr.update_note(
+async def update_note(
+    note_id: str, req: NoteUpdateRequest, mgr: NotesManager = Depends(get_notes_manager)
+) -> NoteUpdateResponse:
+    updated = await asyncio.to_thread(
+        mgr.update_note,
         note_id,
         title=req.title,
         content=req.content,
@@ -60,12 +86,13 @@ async def update_note(note_id: str, req: NoteUpdateRequest) -> NoteUpdateRespons
     return NoteUpdateResponse(updated=True)
 
 
-@router.delete("/{note_id}", response_model=NoteDeleteResponse)
-async def delete_note(note_id: str) -> NoteDeleteResponse:
-    mgr = NotesManager()
-    deleted = mgr.delete_note(note_id)
+@router.delete("/{note_id}", response_model=None, responses={200: {"model": NoteDeleteResponse}})
+async def delete_note(
+    note_id: str, mgr: NotesManager = Depends(get_notes_manager)
+) -> dict[str, bool]:
+    deleted = await asyncio.to_thread(mgr.delete_note, note_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="note_not_found")
-    return NoteDeleteResponse(deleted=True)
+    return {"deleted": True}
 
 
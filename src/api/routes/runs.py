@@ -2,43 +2,146 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from ..schemas.runs import ReportsListResponse, RunDataResponse, RunsListResponse
 
 router = APIRouter(tags=["runs"])
 
 
+def _list_entries(directory: Path, *, dirs: bool) -> list[str]:
+    # Blocking filesystem walk; callers run it in a worker thread. scandir's DirEntry
+    # answers is_dir()/is_file() from the directory listing without a stat per entry.
+    try:
+        with os.scandir(directory) as it:
+            return sorted(e.name for e in it if (e.is_dir() if dirs else e.is_file()))
+    except FileNotFoundError:
+        return []
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _validator_headers(st: os.stat_result) -> dict[str, str]:
+    return {
+        "ETag": f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+    }
+
+
+def _not_modified(request: Request, st: os.stat_result, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(st.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def _list_dir_conditional(
+    request: Request, response: Response, directory: Path, *, dirs: bool
+) -> list[str] | Response:
+    # Directory mtime changes whenever an entry is added, removed or renamed.
+    st = await asyncio.to_thread(_stat, directory)
+    if st is None:
+        return []
+    headers = _validator_headers(st)
+    if _not_modified(request, st, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return await asyncio.to_thread(_list_entries, directory, dirs=dirs)
+
+
+def _read_live_run(run_dir: Path, request: Request) -> tuple[bytes | None, dict[str, str]] | None:
+    # A run still in progress has no run_data.json yet: rebuild the same shape from the
+    # tracer's stats.json summary and its append-only operations.ndjson log.
+    ops_file = run_dir / "operations.ndjson"
+    st = _stat(ops_file)
+    if st is None:
+        return None
+    headers = _validator_headers(st)
+    if _not_modified(request, st, headers["ETag"]):
+        return None, headers
+
+    try:
+        summary = orjson.loads((run_dir / "stats.json").read_bytes())
+    except FileNotFoundError:
+        summary = {}
+    operations = []
+    with open(ops_file, "rb") as f:
+        for line in f:
+            # A line still being appended has no trailing newline yet
+            if line.endswith(b"\n"):
+                operations.append(orjson.loads(line))
+
+    run_data = {
+        "run_id": summary.get("run_name", run_dir.name),
+        "run_name": summary.get("run_name", run_dir.name),
+        "start_time": summary.get("start_time"),
+        "end_time": summary.get("end_time"),
+        "statistics": summary.get("statistics", {}),
+        "operations": operations,
+        "errors": [op for op in operations if op.get("status") == "failed"],
+    }
+    return orjson.dumps(run_data), headers
+
+
+def _read_run_file(run_file: Path, request: Request) -> tuple[bytes | None, dict[str, str]] | None:
+    st = _stat(run_file)
+    if st is None:
+        return _read_live_run(run_file.parent, request)
+    headers = _validator_headers(st)
+    if _not_modified(request, st, headers["ETag"]):
+        return None, headers
+    return run_file.read_bytes(), headers
+
+
 @router.get("/runs", response_model=RunsListResponse)
-async def list_runs() -> RunsListResponse:
-    runs_dir = Path.cwd() / "telegram_runs"
-    if not runs_dir.exists():
-        return RunsListResponse(runs=[])
-    runs = sorted([p.name for p in runs_dir.iterdir() if p.is_dir()])
+async def list_runs(request: Request, response: Response) -> RunsListResponse | Response:
+    runs = await _list_dir_conditional(request, response, Path.cwd() / "telegram_runs", dirs=True)
+    if isinstance(runs, Response):
+        return runs
     return RunsListResponse(runs=runs)
 
 
-@router.get("/runs/{run_name}", response_model=RunDataResponse)
-async def get_run(run_name: str) -> RunDataResponse:
+@router.get("/runs/{run_name}", responses={200: {"model": RunDataResponse}})
+async def get_run(run_name: str, request: Request) -> Response:
     run_file = Path.cwd() / "telegram_runs" / run_name / "run_data.json"
-    if not run_file.exists():
-        raise HTTPException(status_code=404, detail="run_not_found")
     try:
-        data = json.loads(run_file.read_text(encoding="utf-8"))
-        return RunDataResponse(run_name=run_name, data=data)
+        # run_data.json is written by the tracer as valid JSON; splice it in as-is
+        # instead of parsing, validating and re-serializing it. Runs in progress are
+        # rebuilt from their operations log.
+        result = await asyncio.to_thread(_read_run_file, run_file, request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail="run_not_found")
+    data, headers = result
+    if data is None:
+        return Response(status_code=304, headers=headers)
+    body = b'{"run_name":' + json.dumps(run_name).encode("utf-8") + b',"data":' + data + b"}"
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/reports", response_model=ReportsListResponse)
-async def list_reports() -> ReportsListResponse:
-    reports_dir = Path.cwd() / "reports"
-    if not reports_dir.exists():
-        return ReportsListResponse(reports=[])
-    reports = sorted([p.name for p in reports_dir.iterdir() if p.is_file()])
+async def list_reports(request: Request, response: Response) -> ReportsListResponse | Response:
+    reports = await _list_dir_conditional(request, response, Path.cwd() / "reports", dirs=False)
+    if isinstance(reports, Response):
+        return reports
     return ReportsListResponse(reports=reports)
-
-
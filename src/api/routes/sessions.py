@@ -2,29 +2,35 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from telegram_bot.session import SessionManager
 from telegram_bot.utils import extract_phone_number
 
 from ..schemas.sessions import SessionDeleteResponse, SessionListResponse
+from ..services.browser_runner import get_browser_pool, get_shared_session_manager
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
+def get_session_manager() -> SessionManager:
+    return get_shared_session_manager()
+
+
 @router.get("", response_model=SessionListResponse)
-async def list_sessions() -> SessionListResponse:
-    sm = SessionManager()
+async def list_sessions(sm: SessionManager = Depends(get_session_manager)) -> SessionListResponse:
     return SessionListResponse(sessions=sm.list_sessions())
 
 
-@router.delete("/{phone}", response_model=SessionDeleteResponse)
-async def delete_session(phone: str) -> SessionDeleteResponse:
-    sm = SessionManager()
+@router.delete("/{phone}", response_model=None, responses={200: {"model": SessionDeleteResponse}})
+async def delete_session(
+    phone: str, sm: SessionManager = Depends(get_session_manager)
+) -> dict[str, bool]:
     phone = extract_phone_number(phone)
     deleted = sm.delete_session(phone)
     if not deleted:
         raise HTTPException(status_code=404, detail="session_not_found")
-    return SessionDeleteResponse(deleted=True)
+    await get_browser_pool().discard(phone)
+    return {"deleted": True}
 
 
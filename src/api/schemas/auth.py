@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 
+from .common import ApiModel
 
-class AuthStartRequest(BaseModel):
+
+class AuthStartRequest(ApiModel):
     phone: str = Field(..., description="Phone number with country code, e.g. +855762923340")
     force: bool = Field(default=False, description="Force new login even if a session exists")
     headless: bool | None = Field(default=None, description="Override server default headless mode")
@@ -13,26 +15,31 @@ class AuthStartRequest(BaseModel):
     run_name: str | None = Field(default=None, description="Optional run name for tracing/reports")
 
 
-class AuthStartResponse(BaseModel):
+class AuthStartResponse(ApiModel):
     job_id: str
     status: str
 
 
-class AuthSubmitOtpRequest(BaseModel):
+class AuthSubmitOtpRequest(ApiModel):
     job_id: str
     otp: str = Field(..., min_length=4, max_length=10)
 
 
-class AuthSubmit2FARequest(BaseModel):
+class AuthSubmit2FARequest(ApiModel):
+    # Leading/trailing spaces can be part of a 2FA password.
+    model_config = ConfigDict(str_strip_whitespace=False)
+
     job_id: str
     password: str = Field(..., min_length=1, max_length=256)
 
 
-class AuthStatusResponse(BaseModel):
+class AuthStatusResponse(ApiModel):
     job_id: str
     status: str
     phone: str | None = None
     run_name: str | None = None
     error: str | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
 
 
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class OkResponse(BaseModel):
+class ApiModel(BaseModel):
+    """Base for API schemas: immutable, unknown fields ignored, strings stripped."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
+
+class OkResponse(ApiModel):
     ok: bool = True
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ApiModel):
     detail: str
 
 
@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import ApiModel
 
-class CheckPhoneRequest(BaseModel):
+
+class CheckPhoneRequest(ApiModel):
     phone: str = Field(..., description="Phone to check")
     session_phone: str = Field(..., description="Phone number of a logged-in session to use")
     headless: bool | None = None
     proxy: str | None = None
 
 
-class CheckPhoneResponse(BaseModel):
+class CheckPhoneResponse(ApiModel):
     exists: bool
 
 
-class AddContactRequest(BaseModel):
+class AddContactRequest(ApiModel):
     phone: str
     first_name: str
     last_name: str | None = ""
@@ -25,7 +27,7 @@ class AddContactRequest(BaseModel):
     proxy: str | None = None
 
 
-class AddContactResponse(BaseModel):
+class AddContactResponse(ApiModel):
     success: bool
 
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import ApiModel
 
-class CreateGroupRequest(BaseModel):
+
+class CreateGroupRequest(ApiModel):
     name: str
     members: list[str] | None = Field(default=None, description="Optional list of member phones to add")
     session_phone: str
@@ -13,11 +15,11 @@ class CreateGroupRequest(BaseModel):
     proxy: str | None = None
 
 
-class CreateGroupResponse(BaseModel):
+class CreateGroupResponse(ApiModel):
     success: bool
 
 
-class AddMembersRequest(BaseModel):
+class AddMembersRequest(ApiModel):
     group_name: str
     phones: list[str]
     session_phone: str
@@ -25,15 +27,15 @@ class AddMembersRequest(BaseModel):
     proxy: str | None = None
 
 
-class AddMembersResponse(BaseModel):
+class AddMembersResponse(ApiModel):
     success: bool
 
 
-class ListGroupsResponse(BaseModel):
+class ListGroupsResponse(ApiModel):
     groups: list[str] = Field(default_factory=list)
 
 
-class GroupInfoResponse(BaseModel):
+class GroupInfoResponse(ApiModel):
     info: dict
 
 
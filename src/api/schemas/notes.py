@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import ApiModel
 
-class NoteCreateRequest(BaseModel):
+
+class NoteCreateRequest(ApiModel):
     title: str
     content: str
     category: str = "general"
@@ -13,30 +15,30 @@ class NoteCreateRequest(BaseModel):
     priority: str = "normal"
 
 
-class NoteCreateResponse(BaseModel):
+class NoteCreateResponse(ApiModel):
     note_id: str
 
 
-class NotesListResponse(BaseModel):
+class NotesListResponse(ApiModel):
     notes: list[dict] = Field(default_factory=list)
 
 
-class NoteUpdateRequest(BaseModel):
+class NoteUpdateRequest(ApiModel):
     title: str | None = None
     content: str | None = None
     tags: list[str] | None = None
     priority: str | None = None
 
 
-class NoteUpdateResponse(BaseModel):
+class NoteUpdateResponse(ApiModel):
     updated: bool
 
 
-class NoteDeleteResponse(BaseModel):
+class NoteDeleteResponse(ApiModel):
     deleted: bool
 
 
-class NoteGetResponse(BaseModel):
+class NoteGetResponse(ApiModel):
     note: dict | None
 
 
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import ApiModel
 
-class RunsListResponse(BaseModel):
+
+class RunsListResponse(ApiModel):
     runs: list[str] = Field(default_factory=list)
 
 
-class RunDataResponse(BaseModel):
+class RunDataResponse(ApiModel):
     run_name: str
     data: dict
 
 
-class ReportsListResponse(BaseModel):
+class ReportsListResponse(ApiModel):
     reports: list[str] = Field(default_factory=list, description="Report filenames under ./reports")
 
 
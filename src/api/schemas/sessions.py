@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import ApiModel
 
-class SessionListResponse(BaseModel):
+
+class SessionListResponse(ApiModel):
     sessions: list[str] = Field(default_factory=list, description="List of phone numbers with saved sessions")
 
 
-class SessionDeleteResponse(BaseModel):
+class SessionDeleteResponse(ApiModel):
     deleted: bool
 
 
@@ -0,0 +1,93 @@
+"""Coalesce concurrent single-item requests into one browser session.
+
+Callers onboarding many contacts tend to fire one request per phone. Each request would
+otherwise check out its own browser and walk the Telegram UI from scratch; batching lets a
+burst of requests sharing a key (session + launch options) run back-to-back on one browser.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchingDispatcher(Generic[K, T, R]):
+    """Collects items per key for up to `window` seconds (or `max_batch` items) and runs
+    them through `handler` in a single call.
+
+    `handler(key, items)` returns one result per item, in order; an exception instance in
+    that list is raised to the matching caller only.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[K, list[T]], Awaitable[list[Any]]],
+        *,
+        window: float = 0.05,
+        max_batch: int = 20,
+    ) -> None:
+        self._handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[K, list[tuple[T, asyncio.Future]]] = {}
+        self._timers: dict[K, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, key: K, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((item, future))
+
+        if len(pending) >= self.max_batch:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: K) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.create_task(self._run(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: K, batch: list[tuple[T, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = await self._handler(key, items)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            results = [e] * len(batch)
+
+        if len(results) != len(batch):
+            # zip() would silently leave the surplus callers awaiting forever.
+            logger.error(
+                "Batch handler for %r returned %d results for %d items", key, len(results), len(batch)
+            )
+            error = RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # Caller went away (e.g. client disconnected).
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -2,18 +2,196 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Callable, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, NamedTuple, Optional
 
 from telegram_bot.browser import TelegramBrowser
 from telegram_bot.browser.browser_adapter import EnhancedBrowserAdapter
 from telegram_bot.session import SessionManager
 from telegram_bot.utils import extract_phone_number
 
+from ..config import get_settings
+
 logger = logging.getLogger(__name__)
 
 
+def create_browser(*, headless: bool, proxy: str | None, use_enhanced_browser: bool) -> Any:
+    """Build (without launching) the browser implementation selected by `use_enhanced_browser`."""
+    if use_enhanced_browser:
+        return EnhancedBrowserAdapter(headless=headless, proxy=proxy)
+    return TelegramBrowser(headless=headless)
+
+
+class PoolKey(NamedTuple):
+    session_phone: str
+    headless: bool
+    proxy: str | None
+    use_enhanced_browser: bool
+
+
+class BrowserPool:
+    """Keeps warm, session-loaded browsers so requests can skip the Chromium cold start.
+
+    Browsers are keyed by session phone and launch options. A browser is returned to the
+    pool only after an operation finished cleanly; on reuse it is navigated back to
+    Telegram Web to reset whatever view the previous operation left open.
+
+    `discard` must be called whenever a session's storage_state changes (re-login,
+    deletion); browsers leased before that are closed on release instead of pooled.
+
+    The pool also keeps each session's last group list for `group_list_ttl` seconds, so
+    repeated /groups/list calls skip re-reading the sidebar; `discard` drops it too.
+    """
+
+    def __init__(
+        self, *, max_idle_per_key: int = 1, idle_ttl: float = 300.0, group_list_ttl: float = 10.0
+    ) -> None:
+        self.max_idle_per_key = max_idle_per_key
+        self.idle_ttl = idle_ttl
+        self.group_list_ttl = group_list_ttl
+        # session phone -> (time.monotonic() when read, group names)
+        self._group_lists: dict[str, tuple[float, list[str]]] = {}
+        self._idle: dict[PoolKey, list[tuple[float, Any]]] = {}
+        # Bumped by discard(); leased browsers remember the generation they were built for.
+        self._generations: dict[str, int] = {}
+        self._leases: dict[int, int] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def _lease(self, key: PoolKey, browser: Any) -> Any:
+        self._leases[id(browser)] = self._generations.get(key.session_phone, 0)
+        return browser
+
+    async def acquire(self, key: PoolKey, storage_state: dict[str, Any]) -> Any:
+        await self.evict_expired()
+        idle = self._idle.get(key)
+        while idle:
+            _, browser = idle.pop()
+            if not idle and self._idle.get(key) is idle:
+                del self._idle[key]
+            if browser.is_running:
+                try:
+                    await browser.goto_telegram()
+                    return self._lease(key, browser)
+                except Exception:
+                    logger.warning("Discarding pooled browser that failed to reset", exc_info=True)
+            await _close_browser(browser)
+
+        browser = create_browser(
+            headless=key.headless, proxy=key.proxy, use_enhanced_browser=key.use_enhanced_browser
+        )
+        try:
+            await browser.launch()
+            await browser.load_context(storage_state)
+            await browser.goto_telegram()
+        except BaseException:
+            await _close_browser(browser)
+            raise
+        return self._lease(key, browser)
+
+    async def release(self, key: PoolKey, browser: Any, *, reusable: bool = True) -> None:
+        generation = self._leases.pop(id(browser), None)
+        # A discard() while the browser was out means its storage_state is stale.
+        stale = generation != self._generations.get(key.session_phone, 0)
+        # Keys are only created for a browser actually pooled: proxy is client-supplied, so
+        # empty entries for every key seen would pile up.
+        if reusable and not stale and browser.is_running:
+            idle = self._idle.get(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append((time.monotonic(), browser))
+                self._idle[key] = idle
+                self._ensure_sweeper()
+                return
+        await _close_browser(browser)
+
+    def cached_group_list(self, session_phone: str) -> Optional[list[str]]:
+        cached = self._group_lists.get(session_phone)
+        if cached and time.monotonic() - cached[0] < self.group_list_ttl:
+            return list(cached[1])
+        return None
+
+    def store_group_list(self, session_phone: str, groups: list[str]) -> None:
+        if self.group_list_ttl > 0:
+            self._group_lists[session_phone] = (time.monotonic(), list(groups))
+
+    def invalidate_group_list(self, session_phone: str) -> None:
+        self._group_lists.pop(session_phone, None)
+
+    async def discard(self, session_phone: str) -> None:
+        """Close browsers for a session whose session file was replaced or deleted."""
+        self._generations[session_phone] = self._generations.get(session_phone, 0) + 1
+        self.invalidate_group_list(session_phone)
+        for key in [k for k in self._idle if k.session_phone == session_phone]:
+            for _, browser in self._idle.pop(key):
+                await _close_browser(browser)
+
+    async def evict_expired(self) -> None:
+        deadline = time.monotonic() - self.idle_ttl
+        for key, idle in list(self._idle.items()):
+            expired = [browser for released_at, browser in idle if released_at < deadline]
+            if not expired:
+                continue
+            idle[:] = [(released_at, b) for released_at, b in idle if released_at >= deadline]
+            if not idle:
+                del self._idle[key]
+            for browser in expired:
+                await _close_browser(browser)
+
+    def _ensure_sweeper(self) -> None:
+        # Started lazily, like the login job sweeper: the pool is built before the loop runs.
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever(), name="browser-pool-sweeper")
+
+    async def _sweep_forever(self) -> None:
+        # Without this, idle browsers outlive their TTL until the next acquire().
+        while self._idle:
+            await asyncio.sleep(self.idle_ttl)
+            try:
+                await self.evict_expired()
+            except Exception:
+                logger.exception("Browser pool eviction failed")
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        self._group_lists.clear()
+        idle, self._idle = self._idle, {}
+        for entries in idle.values():
+            for _, browser in entries:
+                await _close_browser(browser)
+
+
+async def _close_browser(browser: Any) -> None:
+    try:
+        await browser.close()
+    except Exception:
+        logger.exception("Failed to close browser cleanly")
+
+
+@lru_cache(maxsize=1)
+def get_browser_pool() -> BrowserPool:
+    settings = get_settings()
+    return BrowserPool(
+        max_idle_per_key=settings.browser_pool_size,
+        idle_ttl=settings.browser_pool_idle_ttl,
+        group_list_ttl=settings.group_list_ttl,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_session_manager(sessions_dir: str = "sessions") -> SessionManager:
+    # Shared per directory (by routes, login jobs and the pool) so SessionManager's
+    # parsed-session cache survives across requests.
+    return SessionManager(sessions_dir=sessions_dir)
+
+
 @asynccontextmanager
 async def browser_with_session(
     *,
@@ -23,31 +201,45 @@ async def browser_with_session(
     use_enhanced_browser: bool,
     sessions_dir: str = "sessions",
 ) -> AsyncIterator[Any]:
-    """Create a browser, load storage_state from the given session, and yield it.
+    """Yield a browser with the given session's storage_state loaded.
 
-    The browser is always closed at the end.
+    Browsers come from the process-wide `BrowserPool`; they are handed back to it when
+    the operation succeeds and closed when it raises.
     """
     session_phone = extract_phone_number(session_phone)
-    session_manager = SessionManager(sessions_dir=sessions_dir)
+    session_manager = get_shared_session_manager(sessions_dir)
     session_data = session_manager.load_session(session_phone)
     if not session_data:
         raise FileNotFoundError(f"No session found for {session_phone}")
 
-    browser: Any = (
-        EnhancedBrowserAdapter(headless=headless, proxy=proxy)
-        if use_enhanced_browser
-        else TelegramBrowser(headless=headless)
-    )
-
+    pool = get_browser_pool()
+    key = PoolKey(session_phone, headless, proxy, use_enhanced_browser)
+    browser = await pool.acquire(key, session_data["storage_state"])
+    reusable = False
     try:
-        await browser.launch()
-        await browser.load_context(session_data["storage_state"])
-        await browser.goto_telegram()
         yield browser
+        reusable = True
     finally:
-        try:
-            await browser.close()
-        except Exception:
-            logger.exception("Failed to close browser cleanly")
+        await pool.release(key, browser, reusable=reusable)
 
 
+async def prewarm_browser_pool(
+    *,
+    headless: bool,
+    use_enhanced_browser: bool,
+    sessions_dir: str = "sessions",
+) -> None:
+    """Launch one pooled browser per saved session so first requests hit a warm browser."""
+    session_manager = get_shared_session_manager(sessions_dir)
+    pool = get_browser_pool()
+    for phone in session_manager.list_sessions():
+        session_data = session_manager.load_session(phone)
+        if not session_data:
+            continue
+        key = PoolKey(extract_phone_number(phone), headless, None, use_enhanced_browser)
+        try:
+            browser = await pool.acquire(key, session_data["storage_state"])
+        except Exception:
+            logger.exception("Failed to prewarm browser for %s", phone)
+            continue
+        await pool.release(key, browser)
@@ -4,27 +4,41 @@ Why jobs?
 - Playwright browser sessions are expensive.
 - Login requires multiple client round-trips (start -> submit OTP -> optional submit 2FA).
 
-This module keeps job state in memory. For production, this can be swapped out for
-Redis/DB-backed storage plus a proper worker.
+Job records live in a `JobStore` (in-memory by default, see `job_store.py`). Login starts
+are queued and drained by a fixed number of worker tasks, so a burst of `/auth/start`
+calls cannot launch an unbounded number of browsers at once. Jobs own a live Playwright
+browser between requests, so a shared store can only mirror the serializable fields: a
+job must still be served by the process that started it.
+
+Login work is almost entirely CDP/WebSocket I/O between Python and Chromium, so the API
+should run on uvloop: `run_api.py` selects it explicitly and uvicorn's default `--loop auto`
+picks it whenever it is installed (it ships with `uvicorn[standard]`, except on Windows).
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import logging
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Literal, Optional
-
-from telegram_bot.browser import TelegramBrowser
-from telegram_bot.browser.browser_adapter import EnhancedBrowserAdapter
-from telegram_bot.login import TelegramLogin
-from telegram_bot.reporting import ReportGenerator
-from telegram_bot.session import SessionManager
-from telegram_bot.telemetry import Tracer, set_global_tracer
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, Optional
+
 from telegram_bot.utils import extract_phone_number
 
+from ..config import get_settings
+from .job_store import InMemoryJobStore, JobStore
+
+if TYPE_CHECKING:
+    from telegram_bot.login import TelegramLogin
+    from telegram_bot.reporting import ReportGenerator
+    from telegram_bot.session import SessionManager
+    from telegram_bot.telemetry import Tracer
+
 logger = logging.getLogger(__name__)
 
 JobStatus = Literal[
@@ -36,13 +50,16 @@ JobStatus = Literal[
     "failed",
 ]
 
+_TERMINAL_STATUSES = ("completed", "failed")
+
 
 @dataclass
 class LoginJob:
     job_id: str
     status: JobStatus = "queued"
-    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    # Epoch seconds; rendered to ISO-8601 only when serialized (see `to_dict`).
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
 
     phone: Optional[str] = None
     run_name: Optional[str] = None
@@ -54,20 +71,99 @@ class LoginJob:
     session_manager: Optional[SessionManager] = None
     login_handler: Optional[TelegramLogin] = None
 
-    task: Optional[asyncio.Task] = None
+    # time.monotonic() of the transition to completed/failed; drives TTL eviction.
+    finished_at: Optional[float] = None
+
+    # Pulsed on every status change so callers can wait instead of polling.
+    state_changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
 
     def touch(self) -> None:
-        self.updated_at = datetime.now(UTC).isoformat()
+        self.updated_at = time.time()
+
+    def set_status(self, status: JobStatus, *, error: Optional[str] = None) -> None:
+        self.status = status
+        self.error = error
+        self.touch()
+        if status in _TERMINAL_STATUSES:
+            self.finished_at = time.monotonic()
+        # set() wakes every current waiter; clear() re-arms the event for the next change.
+        self.state_changed.set()
+        self.state_changed.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "phone": self.phone,
+            "run_name": self.run_name,
+            "error": self.error,
+            "created_at": datetime.fromtimestamp(self.created_at, UTC).isoformat(),
+            "updated_at": datetime.fromtimestamp(self.updated_at, UTC).isoformat(),
+        }
 
 
 class JobManager:
-    def __init__(self) -> None:
-        self._lock = asyncio.Lock()
-        self._jobs: dict[str, LoginJob] = {}
+    def __init__(
+        self,
+        *,
+        max_concurrent_logins: int = 2,
+        job_ttl: float = 3600.0,
+        sweep_interval: float = 60.0,
+        store: Optional[JobStore] = None,
+    ) -> None:
+        self.store: JobStore = store if store is not None else InMemoryJobStore()
+        self.max_concurrent_logins = max_concurrent_logins
+        self._queue: asyncio.Queue[tuple[LoginJob, bool]] = asyncio.Queue()
+        # Strong references: the event loop only keeps weak refs to running tasks.
+        self._workers: set[asyncio.Task] = set()
+        self.job_ttl = job_ttl
+        self.sweep_interval = sweep_interval
+        self._sweeper: Optional[asyncio.Task] = None
+        # In-flight OTP/2FA submissions keyed by (step, job_id), with a digest of the submitted
+        # code: duplicates of the same input await the same task.
+        self._submissions: dict[tuple[str, str], tuple[bytes, asyncio.Task[LoginJob]]] = {}
+
+    def _ensure_workers(self) -> None:
+        # Started lazily: the manager is created at import time, before the event loop runs.
+        for i in range(len(self._workers), self.max_concurrent_logins):
+            worker = asyncio.create_task(self._worker(), name=f"login-worker:{i}")
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever(), name="login-job-sweeper")
+
+    async def _worker(self) -> None:
+        while True:
+            job, force = await self._queue.get()
+            try:
+                await self._run_login_start(job, force=force)
+            except Exception:
+                logger.exception("Login worker crashed on job %s", job.job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.evict_finished()
+
+    async def evict_finished(self) -> int:
+        """Drop completed/failed jobs older than `job_ttl`; returns how many were evicted."""
+        evicted = 0
+        async for job in self.store.iter_terminal(time.monotonic() - self.job_ttl):
+            await self.store.delete(job.job_id)
+            evicted += 1
+        return evicted
+
+    async def close(self) -> None:
+        tasks = [*self._workers, *([self._sweeper] if self._sweeper else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._sweeper = None
 
     async def get(self, job_id: str) -> Optional[LoginJob]:
-        async with self._lock:
-            return self._jobs.get(job_id)
+        return await self.store.get(job_id)
 
     async def create_login_job(
         self,
@@ -79,53 +175,81 @@ class JobManager:
         use_enhanced_browser: bool,
         run_name: str | None,
     ) -> LoginJob:
+        # Imported on first use: the login stack is only needed once a job is started.
+        from telegram_bot.login import TelegramLogin
+        from telegram_bot.telemetry import Tracer, set_global_tracer
+
+        from .browser_runner import create_browser, get_shared_session_manager
+
         job_id = str(uuid.uuid4())
         phone = extract_phone_number(phone)
-        resolved_run_name = run_name or f"api_login_{phone}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # extract_phone_number is lru_cached; the default name is only formatted when none was given.
+        resolved_run_name = run_name or f"api_login_{phone}_{time.strftime('%Y%m%d_%H%M%S')}"
 
         tracer = Tracer(run_name=resolved_run_name)
+        # Claim the run directory now, off the loop: a taken name gets suffixed, and the
+        # job should report the name its files actually live under.
+        await asyncio.to_thread(tracer.get_run_dir)
         set_global_tracer(tracer)
 
-        browser = (
-            EnhancedBrowserAdapter(headless=headless, proxy=proxy)
-            if use_enhanced_browser
-            else TelegramBrowser(headless=headless)
-        )
-        session_manager = SessionManager()
+        browser = create_browser(headless=headless, proxy=proxy, use_enhanced_browser=use_enhanced_browser)
+        session_manager = get_shared_session_manager()
         login_handler = TelegramLogin(browser, session_manager)
 
         job = LoginJob(
             job_id=job_id,
             status="queued",
             phone=phone,
-            run_name=resolved_run_name,
+            run_name=tracer.run_name,
             tracer=tracer,
             browser=browser,
             session_manager=session_manager,
             login_handler=login_handler,
         )
 
-        async with self._lock:
-            self._jobs[job_id] = job
+        await self.store.set(job)
 
-        job.task = asyncio.create_task(self._run_login_start(job, force=force), name=f"login:{job_id}")
+        self._ensure_workers()
+        self._queue.put_nowait((job, force))
         return job
 
+    async def _coalesce(
+        self, step: str, job_id: str, secret: str, submit: Callable[[], Awaitable[LoginJob]]
+    ) -> LoginJob:
+        # A retried or duplicated submit joins the running browser interaction instead of
+        # failing the status check; shield() keeps one client's disconnect from cancelling it.
+        # Only the same input joins: a different code must not get the first one's result.
+        key = (step, job_id)
+        digest = hashlib.sha256(secret.encode()).digest()
+        entry = self._submissions.get(key)
+        if entry is None:
+            task = asyncio.create_task(submit(), name=f"login-{step}:{job_id}")
+            self._submissions[key] = (digest, task)
+            task.add_done_callback(lambda _: self._submissions.pop(key, None))
+        else:
+            in_flight, task = entry
+            if in_flight != digest:
+                raise ValueError(f"Job {job_id} is already processing a different {step} submission")
+        return await asyncio.shield(task)
+
     async def submit_otp(self, job_id: str, otp: str) -> LoginJob:
+        return await self._coalesce("otp", job_id, otp, lambda: self._submit_otp(job_id, otp))
+
+    async def submit_2fa(self, job_id: str, password: str) -> LoginJob:
+        return await self._coalesce("2fa", job_id, password, lambda: self._submit_2fa(job_id, password))
+
+    async def _submit_otp(self, job_id: str, otp: str) -> LoginJob:
         job = await self._require_job(job_id)
         if job.status != "waiting_for_otp":
             raise ValueError(f"Job {job_id} is not waiting for OTP (status={job.status})")
         if not job.login_handler:
             raise RuntimeError("Job is missing login handler")
 
-        job.status = "running"
-        job.touch()
+        job.set_status("running")
 
         try:
-            await job.login_handler.enter_otp(otp)
-            if await job.login_handler._check_2fa_required():
-                job.status = "waiting_for_2fa"
-                job.touch()
+            if await job.login_handler.enter_otp(otp):
+                job.set_status("waiting_for_2fa")
                 return job
 
             await self._finalize_login(job)
@@ -134,26 +258,35 @@ class JobManager:
             await self._fail_job(job, str(e))
             return job
 
-    async def submit_2fa(self, job_id: str, password: str) -> LoginJob:
+    async def _submit_2fa(self, job_id: str, password: str) -> LoginJob:
         job = await self._require_job(job_id)
         if job.status != "waiting_for_2fa":
             raise ValueError(f"Job {job_id} is not waiting for 2FA (status={job.status})")
         if not job.login_handler:
             raise RuntimeError("Job is missing login handler")
 
-        job.status = "running"
-        job.touch()
+        job.set_status("running")
 
         try:
             ok = await job.login_handler.handle_2fa(password)
             if not ok:
                 raise RuntimeError("2FA verification failed")
-            await self._finalize_login(job)
+            # handle_2fa only returns True once the logged-in UI is confirmed
+            await self._finalize_login(job, verified=True)
             return job
         except Exception as e:
             await self._fail_job(job, str(e))
             return job
 
+    async def await_status_change(self, job_id: str, timeout: float) -> JobStatus:
+        """Wait up to `timeout` seconds for the job's next status change and return the status."""
+        job = await self._require_job(job_id)
+        try:
+            await asyncio.wait_for(job.state_changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return job.status
+
     async def _require_job(self, job_id: str) -> LoginJob:
         job = await self.get(job_id)
         if not job:
@@ -161,8 +294,7 @@ class JobManager:
         return job
 
     async def _run_login_start(self, job: LoginJob, *, force: bool) -> None:
-        job.status = "running"
-        job.touch()
+        job.set_status("running")
         assert job.login_handler is not None
         assert job.browser is not None
 
@@ -182,8 +314,7 @@ class JobManager:
                 await self._finalize_login(job, used_saved_session=True, close_browser=True)
                 return
 
-            job.status = "waiting_for_otp"
-            job.touch()
+            job.set_status("waiting_for_otp")
         except Exception as e:
             await self._fail_job(job, str(e))
 
@@ -192,29 +323,47 @@ class JobManager:
         job: LoginJob,
         *,
         used_saved_session: bool = False,
+        verified: bool = False,
         close_browser: bool = True,
     ) -> None:
         assert job.login_handler is not None
         assert job.browser is not None
         assert job.session_manager is not None
 
-        if not await job.login_handler.check_login_success():
-            raise RuntimeError("Login verification failed")
+        if verified:
+            storage_state = await job.browser.get_storage_state()
+        elif used_saved_session:
+            # The loaded storage state is already authenticated, so it can be read while the
+            # success check is still waiting on the page; it is discarded if the check fails.
+            ok, storage_state = await asyncio.gather(
+                job.login_handler.check_login_success(),
+                job.browser.get_storage_state(),
+            )
+            if not ok:
+                raise RuntimeError("Login verification failed")
+        else:
+            # A fresh login only writes its auth keys once the UI settles: read storage after the check.
+            if not await job.login_handler.check_login_success():
+                raise RuntimeError("Login verification failed")
+            storage_state = await job.browser.get_storage_state()
 
         # Save session (for saved session flows, storage_state may still be valid to refresh on disk).
-        storage_state = await job.browser.get_storage_state()
-        job.session_manager.save_session(job.phone or "", storage_state)
+        await asyncio.to_thread(job.session_manager.save_session, job.phone or "", storage_state)
+        # Pooled browsers still carry the storage_state from before this login.
+        from .browser_runner import get_browser_pool
 
-        job.status = "completed"
-        job.error = None
-        job.touch()
+        await get_browser_pool().discard(job.phone or "")
+
+        job.set_status("completed")
 
         # Finish tracer + generate report.
         if job.tracer:
             job.tracer.finish()
-            report_gen = ReportGenerator()
+            report_gen = _get_report_generator()
             summary = job.tracer.get_summary()
-            report_gen.generate_markdown_report(
+            # Report rendering writes to disk; keep it off the event loop.
+            await asyncio.to_thread(
+                report_gen.generate_markdown_report,
                 job.run_name or job.tracer.run_name,
                 summary["statistics"],
                 job.tracer.operations,
@@ -223,20 +372,44 @@ class JobManager:
 
         if close_browser:
             await job.browser.close()
+            self._release_runtime(job)
 
     async def _fail_job(self, job: LoginJob, error: str) -> None:
-        job.status = "failed"
-        job.error = error
-        job.touch()
+        job.set_status("failed", error=error)
         logger.exception("Job failed: %s", job.job_id)
-        try:
-            if job.tracer:
+        # Best effort, but each step on its own: a tracer failure must not leave the browser open.
+        if job.tracer:
+            with contextlib.suppress(Exception):
                 job.tracer.log_error("api", "login_job", error)
+            with contextlib.suppress(Exception):
                 job.tracer.finish()
-            if job.browser:
+        if job.browser:
+            with contextlib.suppress(Exception):
                 await job.browser.close()
-        except Exception:
-            # best effort
-            pass
+        self._release_runtime(job)
+
+    @staticmethod
+    def _release_runtime(job: LoginJob) -> None:
+        # Finished jobs stay queryable via /auth/status; drop the heavy Playwright/tracer
+        # objects so they don't live as long as the job record.
+        job.browser = None
+        job.login_handler = None
+        job.session_manager = None
+        job.tracer = None
+
+
+@lru_cache(maxsize=1)
+def _get_report_generator() -> ReportGenerator:
+    # Stateless apart from its output dir; imported lazily with the rest of the login stack.
+    from telegram_bot.reporting import ReportGenerator
+
+    return ReportGenerator()
 
 
+@lru_cache(maxsize=1)
+def get_job_manager() -> JobManager:
+    settings = get_settings()
+    return JobManager(
+        max_concurrent_logins=settings.max_concurrent_logins,
+        job_ttl=settings.job_ttl_seconds,
+    )
@@ -0,0 +1,49 @@
+"""Storage backends for login job records.
+
+`JobManager` reads and writes jobs only through the `JobStore` protocol, so the backing
+store can be swapped without touching the login flow. The default keeps records in a
+process-local dict; a shared backend would only be able to hold the serializable fields
+(`LoginJob.to_dict()`), since the live browser objects cannot leave the process.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Optional, Protocol
+
+if TYPE_CHECKING:
+    from .job_manager import LoginJob
+
+
+class JobStore(Protocol):
+    async def get(self, job_id: str) -> Optional[LoginJob]: ...
+
+    async def set(self, job: LoginJob) -> None: ...
+
+    async def delete(self, job_id: str) -> None: ...
+
+    def iter_terminal(self, older_than: float) -> AsyncIterator[LoginJob]:
+        """Yield finished jobs whose `finished_at` is before `older_than` (time.monotonic())."""
+        ...
+
+
+class InMemoryJobStore:
+    """Dict-backed store; the event loop is single-threaded, so no lock is needed."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, LoginJob] = {}
+
+    async def get(self, job_id: str) -> Optional[LoginJob]:
+        return self._jobs.get(job_id)
+
+    async def set(self, job: LoginJob) -> None:
+        self._jobs[job.job_id] = job
+
+    async def delete(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+
+    async def iter_terminal(self, older_than: float) -> AsyncIterator[LoginJob]:
+        # Snapshot first: callers delete while iterating.
+        for job in list(self._jobs.values()):
+            if job.finished_at is not None and job.finished_at < older_than:
+                yield job
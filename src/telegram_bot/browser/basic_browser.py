@@ -8,6 +8,82 @@ from playwright.async_api import Browser, BrowserContext, Page, Playwright, asyn
 
 logger = logging.getLogger(__name__)
 
+# Shared by every context this module creates (fresh launch and restored session).
+_CONTEXT_KWARGS: dict[str, Any] = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+}
+
+# Remove webdriver property to avoid detection
+_STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
+
+
+class _PlaywrightPool:
+    """Process-wide Playwright driver and Chromium processes shared by TelegramBrowser.
+
+    Starting the Playwright driver and a Chromium process costs hundreds of milliseconds,
+    while a new BrowserContext is cheap and still fully isolated (cookies, storage). So
+    each TelegramBrowser gets its own context on a shared browser, one per headless mode.
+    """
+
+    def __init__(self) -> None:
+        self.playwright: Optional[Playwright] = None
+        self._browsers: dict[bool, Browser] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get_browser(self, headless: bool) -> Browser:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Playwright objects are bound to the loop that created them.
+            self.playwright = None
+            self._browsers = {}
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                browser = await self.playwright.chromium.launch(
+                    headless=headless,
+                    args=[
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-blink-features=AutomationControlled",
+                    ],
+                )
+                self._browsers[headless] = browser
+            return browser
+
+    async def shutdown(self) -> None:
+        browsers, self._browsers = self._browsers, {}
+        for browser in browsers.values():
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.error(f"Error closing shared browser: {e}")
+        playwright, self.playwright = self.playwright, None
+        if playwright:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.error(f"Error stopping Playwright: {e}")
+
+
+_pool = _PlaywrightPool()
+
+
+async def shutdown_shared_browsers() -> None:
+    """Close the shared Chromium processes and Playwright driver (call at app shutdown)."""
+    await _pool.shutdown()
+
 
 class TelegramBrowser:
     """Manages Playwright browser instance for Telegram Web automation."""
@@ -31,34 +107,11 @@ class TelegramBrowser:
     async def launch(self) -> None:
         """Launch browser and create context."""
         try:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled",
-                ],
-            )
-
-            self.context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
-                locale="en-US",
-                timezone_id="America/New_York",
-            )
-
-            # Remove webdriver property to avoid detection
-            await self.context.add_init_script(
-                """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                """
-            )
+            self.browser = await _pool.get_browser(self.headless)
+            self.playwright = _pool.playwright
+
+            self.context = await self.browser.new_context(**_CONTEXT_KWARGS)
+            await self.context.add_init_script(_STEALTH_SCRIPT)
 
             self.page = await self.context.new_page()
             self.is_running = True
@@ -78,10 +131,10 @@ class TelegramBrowser:
             raise RuntimeError("Browser not launched. Call launch() first.")
 
         try:
-            await self.page.goto(url, wait_until="networkidle", timeout=self.timeout)
+            # Telegram Web keeps long-poll connections open, so "networkidle" rarely fires
+            # before the timeout; callers wait for the element they actually need next.
+            await self.page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
             logger.info(f"Navigated to {url}")
-            # Wait a bit for page to fully load
-            await self.page.wait_for_timeout(2000)
         except Exception as e:
             logger.error(f"Failed to navigate to Telegram: {e}")
             raise
@@ -140,25 +193,8 @@ class TelegramBrowser:
         if self.context:
             await self.context.close()
 
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            locale="en-US",
-            timezone_id="America/New_York",
-            storage_state=storage_state,
-        )
-
-        # Remove webdriver property
-        await self.context.add_init_script(
-            """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            """
-        )
+        self.context = await self.browser.new_context(**_CONTEXT_KWARGS, storage_state=storage_state)
+        await self.context.add_init_script(_STEALTH_SCRIPT)
 
         self.page = await self.context.new_page()
         logger.info("Browser context loaded from storage state")
@@ -175,18 +211,19 @@ class TelegramBrowser:
         return await self.context.storage_state()
 
     async def close(self) -> None:
-        """Close browser and cleanup resources."""
-        try:
-            if self.context:
+        """Close this browser's context; the shared browser process stays up for reuse."""
+        if self.context:
+            try:
                 await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
-            self.is_running = False
-            logger.info("Browser closed")
-        except Exception as e:
-            logger.error(f"Error closing browser: {e}")
+            except Exception as e:
+                logger.error(f"Error closing browser: {e}")
+        # Drop references even if close() failed so the context can be collected.
+        self.context = None
+        self.page = None
+        self.browser = None
+        self.playwright = None
+        self.is_running = False
+        logger.info("Browser closed")
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -1,6 +1,5 @@
 """Adapter to make EnhancedBrowserInstance compatible with TelegramBrowser interface."""
 
-import asyncio
 import logging
 from typing import Any, Optional
 
@@ -38,12 +37,7 @@ class EnhancedBrowserAdapter:
     async def launch(self) -> None:
         """Launch browser and create context."""
         try:
-            # Launch enhanced browser (sync method that runs async internally)
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self.enhanced_browser.launch, "https://web.telegram.org/a/"
-            )
+            result = await self.enhanced_browser.async_launch("https://web.telegram.org/a/")
             self._current_tab_id = result.get("tab_id")
             self.is_running = True
             logger.info("Enhanced browser launched successfully")
@@ -62,14 +56,11 @@ class EnhancedBrowserAdapter:
             await self.launch()
 
         try:
-            loop = asyncio.get_event_loop()
             if self._current_tab_id:
-                await loop.run_in_executor(
-                    None, self.enhanced_browser.goto, url, self._current_tab_id
-                )
+                await self.enhanced_browser.async_goto(url, self._current_tab_id)
             else:
                 # Create new tab if no current tab
-                result = await loop.run_in_executor(None, self.enhanced_browser.new_tab, url)
+                result = await self.enhanced_browser.async_new_tab(url)
                 self._current_tab_id = result.get("tab_id")
             logger.info(f"Navigated to {url}")
         except Exception as e:
@@ -133,8 +124,7 @@ class EnhancedBrowserAdapter:
             # load_context is async in EnhancedBrowserInstance
             await self.enhanced_browser.load_context(storage_state)
             # Get the current tab ID after loading context
-            loop = asyncio.get_event_loop()
-            tabs = await loop.run_in_executor(None, self.enhanced_browser.list_tabs)
+            tabs = await self.enhanced_browser.async_list_tabs()
             if tabs.get("tabs"):
                 self._current_tab_id = tabs.get("current_tab")
             self.is_running = True
@@ -157,9 +147,7 @@ class EnhancedBrowserAdapter:
     async def close(self) -> None:
         """Close browser and cleanup resources."""
         try:
-            # close() is sync in EnhancedBrowserInstance
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.enhanced_browser.close)
+            await self.enhanced_browser.async_close()
             self.is_running = False
             self._current_tab_id = None
             logger.info("Enhanced browser closed")
@@ -4,39 +4,130 @@ import asyncio
 import base64
 import logging
 import threading
+from collections import deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Literal, Optional
 
 from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 
+from .basic_browser import _CONTEXT_KWARGS, _STEALTH_SCRIPT
+
+try:
+    # Optional (the `speedups` extra): SIMD base64 straight to str, with no intermediate
+    # bytes copy of the encoded screenshot.
+    from pybase64 import b64encode_as_string as _b64encode_str
+except ImportError:
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 logger = logging.getLogger(__name__)
 
+
+def screenshot_b64(state: dict[str, Any]) -> str:
+    """Base64-encode a page state's screenshot for JSON/HTTP responses."""
+    return _b64encode_str(state["screenshot_bytes"])
+
+
 MAX_PAGE_SOURCE_LENGTH = 20_000
 MAX_CONSOLE_LOG_LENGTH = 30_000
 MAX_INDIVIDUAL_LOG_LENGTH = 1_000
 MAX_CONSOLE_LOGS_COUNT = 200
 MAX_JS_RESULT_LENGTH = 5_000
+# Approximate characters a console entry adds beyond its text and type (keys, location, timestamp)
+_LOG_ENTRY_OVERHEAD = 64
+SCREENSHOT_JPEG_QUALITY = 75
+
+# Applied to a JS result in the page: values whose JSON form exceeds the limit come back as a
+# truncated string, so oversized results never cross CDP or get materialized in Python.
+_BOUND_JS_RESULT_JS = """([r, max]) => {
+    let s;
+    try { s = typeof r === "string" ? r : JSON.stringify(r); } catch (e) { s = String(r); }
+    if (s === undefined || s.length <= max) return r;
+    return s.slice(0, max) + "... [JS result truncated]";
+}"""
+
+# Installed in every document: a counter bumped by anything that can change what is
+# painted -- DOM mutations, plus events for state the DOM does not reflect (input values,
+# scrolling, focus, hover, finished image loads and CSS transitions/animations). Canvas and
+# video repaint without any of these, so pages containing them report no version at all.
+_PAINT_VERSION_SCRIPT = """(() => {
+    let version = 0;
+    const bump = () => { version++; };
+    new MutationObserver(bump).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    for (const type of ["input", "change", "scroll", "focusin", "focusout", "mouseover",
+                        "mouseout", "load", "error", "transitionend", "animationend"]) {
+        document.addEventListener(type, bump, true);
+    }
+    Object.defineProperty(window, "__tgPaintVersion", {
+        get: () => (document.querySelector("canvas, video") ? null : version),
+    });
+})();"""
+
+# Page fingerprint read in O(1): if it is unchanged since the last screenshot, the cached one
+# is reused. null (no tracker, or canvas/video present) disables the cache for that capture.
+_DOM_FINGERPRINT_JS = """() => {
+    const v = window.__tgPaintVersion;
+    return v == null ? null : v + ":" + scrollX + "," + scrollY + ":" + location.href;
+}"""
+
+
+async def _tab_title(page: Page) -> str:
+    return "Closed" if page.is_closed() else await page.title()
 
 
 class EnhancedBrowserInstance:
     """Enhanced browser instance with tab management and advanced features."""
 
-    def __init__(self, headless: bool = False, proxy: Optional[str] = None):
+    def __init__(
+        self,
+        headless: bool = False,
+        proxy: Optional[str] = None,
+        screenshot_format: Literal["jpeg", "png"] = "jpeg",
+    ):
         """
         Initialize enhanced browser instance.
 
         Args:
             headless: Whether to run browser in headless mode
             proxy: Proxy string in format "ip:port:username:password" for SOCKS5 proxy
+            screenshot_format: Page-state screenshot encoding; JPEG is much cheaper to
+                encode than PNG, which callers needing lossless images can opt into
         """
         self.headless = headless
         self.proxy = proxy
+        self.screenshot_format = screenshot_format
         self.is_running = True
         self._execution_lock = threading.Lock()
+        # async_* callers share one event loop. Tab work shares the context with work on
+        # other tabs and holds its own tab's lock; browser-level ops (launch, context swap,
+        # close) take the browser lock, close the gate to new tab work and wait for the
+        # running tab work to drain (see _tab_work / _context_work).
+        self._browser_lock = asyncio.Lock()
+        self._context_gate = asyncio.Event()
+        self._context_gate.set()
+        self._tabs_idle = asyncio.Event()
+        self._tabs_idle.set()
+        self._tab_ops = 0
+        # Per-tab locks with their holder/waiter counts; an entry is dropped at zero only.
+        self._tab_locks: dict[str, asyncio.Lock] = {}
+        self._tab_lock_users: dict[str, int] = {}
 
         # Parse proxy settings
         self.proxy_config = self._parse_proxy(proxy) if proxy else None
 
+        # new_context() arguments, built once and shared by launch and load_context
+        self._context_args: dict[str, Any] = dict(_CONTEXT_KWARGS)
+        if self.proxy_config:
+            self._context_args["proxy"] = {
+                "server": self.proxy_config["server"],
+                "username": self.proxy_config["username"],
+                "password": self.proxy_config["password"],
+            }
+
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
@@ -44,26 +135,40 @@ class EnhancedBrowserInstance:
         self.current_page_id: Optional[str] = None
         self._next_tab_id = 1
 
-        self.console_logs: dict[str, list[dict[str, Any]]] = {}
-
+        # Bounded per tab: the deque drops the oldest entry once MAX_CONSOLE_LOGS_COUNT is reached.
+        self.console_logs: dict[str, deque[dict[str, Any]]] = {}
+        # Per-entry sizes (kept in step with console_logs) and their running total per tab.
+        self._console_log_sizes: dict[str, deque[int]] = {}
+        self._console_log_chars: dict[str, int] = {}
+        # Storage state the current context was created from (None for a fresh launch)
+        self._loaded_storage_state: Optional[dict[str, Any]] = None
+        # tab_id -> (DOM fingerprint, screenshot bytes) of the last page-state snapshot
+        self._snapshot_cache: dict[str, tuple[str, bytes]] = {}
+
+        # Helper loop thread backing the synchronous API; started on first sync call, so
+        # async callers (async_* methods) never pay for the thread or the cross-thread hop.
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._loop_thread: Optional[threading.Thread] = None
 
-        self._start_event_loop()
-
     def _start_event_loop(self) -> None:
         """Start async event loop in separate thread."""
+        ready = threading.Event()
 
         def run_loop() -> None:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-            self._loop.run_forever()
+            try:
+                import uvloop
+
+                loop = uvloop.new_event_loop()
+            except ImportError:
+                loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            ready.set()
+            loop.run_forever()
 
         self._loop_thread = threading.Thread(target=run_loop, daemon=True)
         self._loop_thread.start()
-
-        while self._loop is None:
-            threading.Event().wait(0.01)
+        ready.wait()
 
     def _parse_proxy(self, proxy_string: str) -> dict[str, Any]:
         """
@@ -96,15 +201,23 @@ class EnhancedBrowserInstance:
 
     def _run_async(self, coro: Any) -> dict[str, Any]:
         """Run async coroutine in event loop."""
-        if not self._loop or not self.is_running:
+        if not self.is_running:
+            coro.close()
             raise RuntimeError("Browser instance is not running")
+        if not self._loop:
+            self._start_event_loop()
 
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
         return future.result(timeout=30)
 
     async def _setup_console_logging(self, page: Page, tab_id: str) -> None:
         """Setup console logging for a page."""
-        self.console_logs[tab_id] = []
+        logs: deque[dict[str, Any]] = deque(maxlen=MAX_CONSOLE_LOGS_COUNT)
+        sizes: deque[int] = deque(maxlen=MAX_CONSOLE_LOGS_COUNT)
+        self.console_logs[tab_id] = logs
+        self._console_log_sizes[tab_id] = sizes
+        self._console_log_chars[tab_id] = 0
+        loop = asyncio.get_running_loop()
 
         def handle_console(msg: Any) -> None:
             text = msg.text
@@ -115,13 +228,16 @@ class EnhancedBrowserInstance:
                 "type": msg.type,
                 "text": text,
                 "location": msg.location,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": loop.time(),
             }
 
-            self.console_logs[tab_id].append(log_entry)
-
-            if len(self.console_logs[tab_id]) > MAX_CONSOLE_LOGS_COUNT:
-                self.console_logs[tab_id] = self.console_logs[tab_id][-MAX_CONSOLE_LOGS_COUNT:]
+            size = len(text) + len(msg.type) + _LOG_ENTRY_OVERHEAD
+            if len(sizes) == MAX_CONSOLE_LOGS_COUNT:
+                # The deques are about to drop their oldest entry.
+                self._console_log_chars[tab_id] -= sizes[0]
+            logs.append(log_entry)
+            sizes.append(size)
+            self._console_log_chars[tab_id] += size
 
         page.on("console", handle_console)
 
@@ -150,36 +266,12 @@ class EnhancedBrowserInstance:
             args=launch_args,
         )
 
-        # Prepare context arguments
-        context_args = {
-            "viewport": {"width": 1920, "height": 1080},
-            "user_agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "locale": "en-US",
-            "timezone_id": "America/New_York",
-        }
-
-        # Add proxy configuration to context if available
         if self.proxy_config:
-            context_args["proxy"] = {
-                "server": self.proxy_config["server"],
-                "username": self.proxy_config["username"],
-                "password": self.proxy_config["password"]
-            }
             logger.info(f"Context configured with proxy authentication for user: {self.proxy_config['username']}")
 
-        self.context = await self.browser.new_context(**context_args)
-
-        # Remove webdriver property to avoid detection
-        await self.context.add_init_script(
-            """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            """
-        )
+        self.context = await self.browser.new_context(**self._context_args)
+        await self.context.add_init_script(_STEALTH_SCRIPT)
+        await self.context.add_init_script(_PAINT_VERSION_SCRIPT)
 
         page = await self.context.new_page()
         tab_id = f"tab_{self._next_tab_id}"
@@ -194,8 +286,10 @@ class EnhancedBrowserInstance:
 
         return await self._get_page_state(tab_id)
 
-    async def _get_page_state(self, tab_id: Optional[str] = None) -> dict[str, Any]:
-        """Get current page state with screenshot."""
+    async def _get_page_state(
+        self, tab_id: Optional[str] = None, include_all_tabs: bool = False
+    ) -> dict[str, Any]:
+        """Get current page state with screenshot; `all_tabs` is only built when requested."""
         if not tab_id:
             tab_id = self.current_page_id
 
@@ -204,33 +298,59 @@ class EnhancedBrowserInstance:
 
         page = self.pages[tab_id]
 
-        await asyncio.sleep(0.5)  # Small delay for page stability
-
-        screenshot_bytes = await page.screenshot(type="png", full_page=False)
-        screenshot_b64 = base64.b64encode(screenshot_bytes).decode("utf-8")
-
-        url = page.url
-        title = await page.title()
-        viewport = page.viewport_size
+        screenshot_bytes = await self._screenshot(page, tab_id)
 
+        # Raw bytes: in-process callers need no base64; JSON edges use screenshot_b64().
+        state = {
+            "screenshot_bytes": screenshot_bytes,
+            "screenshot_format": self.screenshot_format,
+            "url": page.url,
+            "title": None,
+            "viewport": page.viewport_size,
+            "tab_id": tab_id,
+        }
+        if not include_all_tabs:
+            state["title"] = await page.title()
+            return state
+
+        # One CDP round-trip per tab, issued concurrently; the current tab's title is among them.
+        tabs = list(self.pages.items())
+        titles = await asyncio.gather(
+            *(_tab_title(tab_page) for _, tab_page in tabs), return_exceptions=True
+        )
         all_tabs = {}
-        for tid, tab_page in self.pages.items():
-            try:
-                all_tabs[tid] = {
-                    "url": tab_page.url,
-                    "title": await tab_page.title() if not tab_page.is_closed() else "Closed",
-                }
-            except Exception:
+        for (tid, tab_page), tab_title in zip(tabs, titles):
+            if isinstance(tab_title, BaseException):
                 all_tabs[tid] = {"url": "Unknown", "title": "Closed"}
+            else:
+                all_tabs[tid] = {"url": tab_page.url, "title": tab_title}
+        state["title"] = all_tabs[tab_id]["title"]
+        state["all_tabs"] = all_tabs
+        return state
 
-        return {
-            "screenshot": screenshot_b64,
-            "url": url,
-            "title": title,
-            "viewport": viewport,
-            "tab_id": tab_id,
-            "all_tabs": all_tabs,
-        }
+    async def _screenshot(self, page: Page, tab_id: str) -> bytes:
+        """Return a screenshot, reusing the cached one while the page fingerprint is unchanged."""
+        try:
+            fingerprint = await page.evaluate(_DOM_FINGERPRINT_JS)
+        except Exception:
+            fingerprint = None
+
+        cached = self._snapshot_cache.get(tab_id)
+        if fingerprint is not None and cached and cached[0] == fingerprint:
+            return cached[1]
+
+        # Frozen animations and a hidden caret spare compositor work and keep repeated
+        # captures of an idle page identical; scale="css" skips device-pixel upscaling.
+        options: dict[str, Any] = {"animations": "disabled", "caret": "hide", "scale": "css"}
+        if self.screenshot_format == "jpeg":
+            options["quality"] = SCREENSHOT_JPEG_QUALITY
+        screenshot_bytes = await page.screenshot(
+            type=self.screenshot_format, full_page=False, **options
+        )
+
+        if fingerprint is not None:
+            self._snapshot_cache[tab_id] = (fingerprint, screenshot_bytes)
+        return screenshot_bytes
 
     def launch(self, url: Optional[str] = None) -> dict[str, Any]:
         """Launch browser."""
@@ -239,6 +359,100 @@ class EnhancedBrowserInstance:
                 raise ValueError("Browser is already launched")
             return self._run_async(self._launch_browser(url))
 
+    @asynccontextmanager
+    async def _context_shared(self) -> AsyncIterator[None]:
+        """Use the current context alongside other tab work, never during a context op."""
+        while not self._context_gate.is_set():
+            await self._context_gate.wait()
+        self._tab_ops += 1
+        self._tabs_idle.clear()
+        try:
+            yield
+        finally:
+            self._tab_ops -= 1
+            if not self._tab_ops:
+                self._tabs_idle.set()
+
+    @asynccontextmanager
+    async def _tab_work(self, tab_id: Optional[str] = None) -> AsyncIterator[None]:
+        """Hold one tab (None = current tab) exclusively while sharing the context."""
+        async with self._context_shared():
+            key = tab_id or self.current_page_id
+            lock = self._tab_locks.setdefault(key, asyncio.Lock())
+            self._tab_lock_users[key] = self._tab_lock_users.get(key, 0) + 1
+            try:
+                async with lock:
+                    yield
+            finally:
+                self._tab_lock_users[key] -= 1
+                if not self._tab_lock_users[key]:
+                    del self._tab_lock_users[key]
+                    del self._tab_locks[key]
+
+    @asynccontextmanager
+    async def _context_work(self) -> AsyncIterator[None]:
+        """Exclude all tab work: new tab work waits, running tab work is drained first."""
+        async with self._browser_lock:
+            self._context_gate.clear()
+            try:
+                await self._tabs_idle.wait()
+                yield
+            finally:
+                self._context_gate.set()
+
+    async def async_launch(self, url: Optional[str] = None) -> dict[str, Any]:
+        """Launch browser on the caller's event loop."""
+        async with self._context_work():
+            if self.browser is not None:
+                raise ValueError("Browser is already launched")
+            return await self._launch_browser(url)
+
+    async def async_goto(self, url: str, tab_id: Optional[str] = None) -> dict[str, Any]:
+        """Navigate to URL on the caller's event loop."""
+        async with self._tab_work(tab_id):
+            return await self._goto(url, tab_id)
+
+    async def async_new_tab(self, url: Optional[str] = None) -> dict[str, Any]:
+        """Create new tab on the caller's event loop."""
+        async with self._context_shared():
+            return await self._new_tab(url)
+
+    async def async_switch_tab(self, tab_id: str) -> dict[str, Any]:
+        """Switch to different tab on the caller's event loop."""
+        async with self._tab_work(tab_id):
+            return await self._switch_tab(tab_id)
+
+    async def async_close_tab(self, tab_id: str) -> dict[str, Any]:
+        """Close a tab on the caller's event loop."""
+        # Waits for in-flight work on the tab; callers queued behind it find it gone.
+        async with self._tab_work(tab_id):
+            return await self._close_tab(tab_id)
+
+    async def async_list_tabs(self) -> dict[str, Any]:
+        """List all tabs on the caller's event loop."""
+        async with self._context_shared():
+            return await self._list_tabs()
+
+    async def async_get_console_logs(
+        self, tab_id: Optional[str] = None, clear: bool = False
+    ) -> dict[str, Any]:
+        """Get console logs for a tab on the caller's event loop."""
+        async with self._tab_work(tab_id):
+            return await self._get_console_logs(tab_id, clear)
+
+    async def async_execute_js(self, js_code: str, tab_id: Optional[str] = None) -> dict[str, Any]:
+        """Execute JavaScript code on the caller's event loop."""
+        async with self._tab_work(tab_id):
+            return await self._execute_js(js_code, tab_id)
+
+    async def async_close(self) -> None:
+        """Close browser on the caller's event loop and stop the helper loop thread."""
+        self.is_running = False
+        async with self._context_work():
+            await self._close_browser()
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
     def goto(self, url: str, tab_id: Optional[str] = None) -> dict[str, Any]:
         """Navigate to URL."""
         with self._execution_lock:
@@ -253,6 +467,7 @@ class EnhancedBrowserInstance:
             raise ValueError(f"Tab '{tab_id}' not found")
 
         page = self.pages[tab_id]
+        self._snapshot_cache.pop(tab_id, None)
         await page.goto(url, wait_until="domcontentloaded")
         return await self._get_page_state(tab_id)
 
@@ -277,7 +492,7 @@ class EnhancedBrowserInstance:
         if url:
             await page.goto(url, wait_until="domcontentloaded")
 
-        return await self._get_page_state(tab_id)
+        return await self._get_page_state(tab_id, include_all_tabs=True)
 
     def switch_tab(self, tab_id: str) -> dict[str, Any]:
         """Switch to different tab."""
@@ -290,7 +505,7 @@ class EnhancedBrowserInstance:
             raise ValueError(f"Tab '{tab_id}' not found")
 
         self.current_page_id = tab_id
-        return await self._get_page_state(tab_id)
+        return await self._get_page_state(tab_id, include_all_tabs=True)
 
     def close_tab(self, tab_id: str) -> dict[str, Any]:
         """Close a tab."""
@@ -310,11 +525,14 @@ class EnhancedBrowserInstance:
 
         if tab_id in self.console_logs:
             del self.console_logs[tab_id]
+            del self._console_log_sizes[tab_id]
+            del self._console_log_chars[tab_id]
+        self._snapshot_cache.pop(tab_id, None)
 
         if self.current_page_id == tab_id:
             self.current_page_id = next(iter(self.pages.keys()))
 
-        return await self._get_page_state(self.current_page_id)
+        return await self._get_page_state(self.current_page_id, include_all_tabs=True)
 
     def list_tabs(self) -> dict[str, Any]:
         """List all tabs."""
@@ -355,37 +573,33 @@ class EnhancedBrowserInstance:
         if not tab_id or tab_id not in self.pages:
             raise ValueError(f"Tab '{tab_id}' not found")
 
-        logs = self.console_logs.get(tab_id, [])
+        logs = list(self.console_logs.get(tab_id, ()))
 
-        total_length = sum(len(str(log)) for log in logs)
-        if total_length > MAX_CONSOLE_LOG_LENGTH:
-            truncated_logs: list[dict[str, Any]] = []
+        if self._console_log_chars.get(tab_id, 0) > MAX_CONSOLE_LOG_LENGTH:
+            # Keep the newest entries that fit, walking back only as far as needed.
+            kept = 0
             current_length = 0
-
-            for log in reversed(logs):
-                log_length = len(str(log))
-                if current_length + log_length <= MAX_CONSOLE_LOG_LENGTH:
-                    truncated_logs.insert(0, log)
-                    current_length += log_length
-                else:
+            for log_length in reversed(self._console_log_sizes[tab_id]):
+                if current_length + log_length > MAX_CONSOLE_LOG_LENGTH:
                     break
+                current_length += log_length
+                kept += 1
+
+            truncation_notice = {
+                "type": "info",
+                "text": (
+                    f"[TRUNCATED: {len(logs) - kept} older logs "
+                    f"removed to stay within {MAX_CONSOLE_LOG_LENGTH} character limit]"
+                ),
+                "location": {},
+                "timestamp": 0,
+            }
+            logs = [truncation_notice, *logs[len(logs) - kept :]]
 
-            if len(truncated_logs) < len(logs):
-                truncation_notice = {
-                    "type": "info",
-                    "text": (
-                        f"[TRUNCATED: {len(logs) - len(truncated_logs)} older logs "
-                        f"removed to stay within {MAX_CONSOLE_LOG_LENGTH} character limit]"
-                    ),
-                    "location": {},
-                    "timestamp": 0,
-                }
-                truncated_logs.insert(0, truncation_notice)
-
-            logs = truncated_logs
-
-        if clear:
-            self.console_logs[tab_id] = []
+        if clear and tab_id in self.console_logs:
+            self.console_logs[tab_id].clear()
+            self._console_log_sizes[tab_id].clear()
+            self._console_log_chars[tab_id] = 0
 
         state = await self._get_page_state(tab_id)
         state["console_logs"] = logs
@@ -405,20 +619,22 @@ class EnhancedBrowserInstance:
             raise ValueError(f"Tab '{tab_id}' not found")
 
         page = self.pages[tab_id]
+        # Script side effects (e.g. canvas or style changes) may not move the DOM fingerprint.
+        self._snapshot_cache.pop(tab_id, None)
 
         try:
-            result = await page.evaluate(js_code)
+            handle = await page.evaluate_handle(js_code)
+            try:
+                result = await page.evaluate(_BOUND_JS_RESULT_JS, [handle, MAX_JS_RESULT_LENGTH])
+            finally:
+                await handle.dispose()
         except Exception as e:
             result = {
                 "error": True,
                 "error_type": type(e).__name__,
-                "error_message": str(e),
+                "error_message": str(e)[:MAX_JS_RESULT_LENGTH],
             }
 
-        result_str = str(result)
-        if len(result_str) > MAX_JS_RESULT_LENGTH:
-            result = result_str[:MAX_JS_RESULT_LENGTH] + "... [JS result truncated]"
-
         state = await self._get_page_state(tab_id)
         state["js_result"] = result
         return state
@@ -434,31 +650,33 @@ class EnhancedBrowserInstance:
         return self.pages[tab_id]
 
     async def load_context(self, storage_state: dict[str, Any]) -> None:
-        """Load browser context from storage state."""
+        """Load browser context from storage state, once running tab work has finished."""
+        async with self._context_work():
+            await self._load_context(storage_state)
+
+    async def _load_context(self, storage_state: dict[str, Any]) -> None:
         if not self.playwright:
             await self._launch_browser()
 
         if self.context:
+            # Compare with the state this context was built from rather than dumping the
+            # live context: storage_state() serializes every cookie and origin over CDP.
+            if self._loaded_storage_state is not None and self._loaded_storage_state == storage_state:
+                # Already carrying this session: keep the context and its tabs.
+                logger.debug("Storage state unchanged, reusing browser context")
+                return
             await self.context.close()
-
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            locale="en-US",
-            timezone_id="America/New_York",
-            storage_state=storage_state,
-        )
-
-        await self.context.add_init_script(
-            """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            """
-        )
+            # Tabs of the closed context are dead; drop them with their per-tab state.
+            self.pages.clear()
+            self.console_logs.clear()
+            self._console_log_sizes.clear()
+            self._console_log_chars.clear()
+            self._snapshot_cache.clear()
+
+        self.context = await self.browser.new_context(**self._context_args, storage_state=storage_state)
+        self._loaded_storage_state = storage_state
+        await self.context.add_init_script(_STEALTH_SCRIPT)
+        await self.context.add_init_script(_PAINT_VERSION_SCRIPT)
 
         page = await self.context.new_page()
         tab_id = f"tab_{self._next_tab_id}"
@@ -1,6 +1,7 @@
 """Contact management for Telegram automation."""
 
 import asyncio
+import contextlib
 import logging
 from typing import Optional, Union
 
@@ -9,10 +10,67 @@ from playwright.async_api import Page
 from .browser import TelegramBrowser
 from .browser.browser_adapter import EnhancedBrowserAdapter
 from .telemetry import get_global_tracer
-from .utils import ElementNotFoundError, safe_click, wait_for_selector
+from .utils import (
+    ElementNotFoundError,
+    first_matching_selector,
+    safe_click,
+    wait_for_any_selector,
+)
 
 logger = logging.getLogger(__name__)
 
+# Selector candidates for Telegram Web, tried in order.
+_SEARCH_SELECTORS = (
+    'input[placeholder*="Search" i]',
+    'input[type="search"]',
+    '.search-input',
+    '[aria-label*="Search" i]',
+)
+_RESULT_SELECTORS = (
+    '.search-result',
+    '.contact',
+    '[data-testid="search-result"]',
+    '.user-item',
+)
+_MENU_SELECTORS = (
+    'button[aria-label*="Menu" i]',
+    'button[aria-label*="Settings" i]',
+    '.menu-button',
+    '[data-testid="menu-button"]',
+)
+_CONTACT_SELECTORS = (
+    'button:has-text("Contacts")',
+    'button:has-text("Add Contact")',
+    'a:has-text("Contacts")',
+    '[aria-label*="Contact" i]',
+)
+_NEW_CONTACT_SELECTORS = (
+    'button:has-text("New Contact")',
+    'button:has-text("Add Contact")',
+    'button:has-text("Add")',
+    '[aria-label*="Add Contact" i]',
+)
+_FIRST_NAME_SELECTORS = (
+    'input[placeholder*="First name" i]',
+    'input[name*="first" i]',
+    'input[type="text"]:first-of-type',
+)
+_LAST_NAME_SELECTORS = (
+    'input[placeholder*="Last name" i]',
+    'input[name*="last" i]',
+)
+_PHONE_SELECTORS = (
+    'input[type="tel"]',
+    'input[placeholder*="phone" i]',
+    'input[name*="phone" i]',
+)
+_SAVE_SELECTORS = (
+    'button:has-text("Save")',
+    'button:has-text("Add")',
+    'button:has-text("Create")',
+    'button[type="submit"]',
+)
+
 
 class ContactManager:
     """Manages Telegram contacts."""
@@ -45,53 +103,31 @@ class ContactManager:
         try:
             # Find and click search/contact icon
             # Common selectors for search in Telegram Web
-            search_selectors = [
-                'input[placeholder*="Search" i]',
-                'input[type="search"]',
-                '.search-input',
-                '[aria-label*="Search" i]',
-            ]
-
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = await wait_for_selector(page, selector, timeout=5000)
-                    break
-                except ElementNotFoundError:
-                    continue
-
-            if not search_input:
+            try:
+                _, search_input = await wait_for_any_selector(page, _SEARCH_SELECTORS, timeout=5000)
+            except ElementNotFoundError:
                 logger.error("Could not find search input")
                 return False
 
             # Click search input and enter phone number
             await search_input.click()
-            await search_input.fill("")
-            await search_input.type(phone, delay=100)
-            await page.wait_for_timeout(2000)  # Wait for search results
+            await search_input.fill(phone)
+            # Wait for search results, but only until the first one renders (at most the old 2s).
+            with contextlib.suppress(ElementNotFoundError):
+                await wait_for_any_selector(page, _RESULT_SELECTORS, timeout=2000)
 
             # Look for user in search results
-            # Common selectors for search results
-            result_selectors = [
-                '.search-result',
-                '.contact',
-                '[data-testid="search-result"]',
-                '.user-item',
-            ]
-
-            # Check if any results appear
-            for selector in result_selectors:
-                try:
-                    results = await page.query_selector_all(selector)
-                    if results:
-                        logger.info(f"Found Telegram account for {phone}")
-                        return True
-                except Exception:
-                    continue
+            # Check if any results appear (all selectors probed in one round-trip)
+            if await first_matching_selector(page, _RESULT_SELECTORS):
+                logger.info(f"Found Telegram account for {phone}")
+                return True
 
-            # Also check if phone number appears in any text on page
-            page_content = await page.content()
-            if phone in page_content or phone.replace("+", "") in page_content:
+            # Also check if phone number appears in any text on page; searched in the page
+            # itself so only a bool crosses CDP instead of the serialized DOM.
+            if await page.evaluate(
+                "([a, b]) => { const t = document.body.innerText; return t.includes(a) || t.includes(b); }",
+                [phone, phone.replace("+", "")],
+            ):
                 logger.info(f"Found phone number reference for {phone}")
                 if self.tracer:
                     self.tracer.log_operation("contact", "check_phone_exists", status="completed", details={"phone": phone, "exists": True})
@@ -129,33 +165,18 @@ class ContactManager:
 
         try:
             # Find menu or settings button to access contacts
-            menu_selectors = [
-                'button[aria-label*="Menu" i]',
-                'button[aria-label*="Settings" i]',
-                '.menu-button',
-                '[data-testid="menu-button"]',
-            ]
-
             menu_clicked = False
-            for selector in menu_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        menu_clicked = True
-                        await page.wait_for_timeout(1000)
-                        break
-                except Exception:
-                    continue
+            try:
+                selector, _ = await wait_for_any_selector(page, _MENU_SELECTORS, timeout=3000)
+                if await safe_click(page, selector, timeout=3000):
+                    menu_clicked = True
+                    await page.wait_for_timeout(1000)
+            except Exception:
+                pass
 
             # Look for "Contacts" or "Add Contact" option
-            contact_selectors = [
-                'button:has-text("Contacts")',
-                'button:has-text("Add Contact")',
-                'a:has-text("Contacts")',
-                '[aria-label*="Contact" i]',
-            ]
-
             contact_clicked = False
-            for selector in contact_selectors:
+            for selector in _CONTACT_SELECTORS:
                 try:
                     if await safe_click(page, selector, timeout=3000):
                         contact_clicked = True
@@ -165,14 +186,7 @@ class ContactManager:
                     continue
 
             # Find "New Contact" or "Add Contact" button
-            new_contact_selectors = [
-                'button:has-text("New Contact")',
-                'button:has-text("Add Contact")',
-                'button:has-text("Add")',
-                '[aria-label*="Add Contact" i]',
-            ]
-
-            for selector in new_contact_selectors:
+            for selector in _NEW_CONTACT_SELECTORS:
                 try:
                     if await safe_click(page, selector, timeout=3000):
                         await page.wait_for_timeout(1000)
@@ -182,64 +196,34 @@ class ContactManager:
 
             # Fill in contact form
             # First name
-            first_name_selectors = [
-                'input[placeholder*="First name" i]',
-                'input[name*="first" i]',
-                'input[type="text"]:first-of-type',
-            ]
-
-            for selector in first_name_selectors:
-                try:
-                    first_name_input = await wait_for_selector(page, selector, timeout=3000)
-                    await first_name_input.click()
-                    await first_name_input.fill(first_name)
-                    break
-                except ElementNotFoundError:
-                    continue
+            try:
+                _, first_name_input = await wait_for_any_selector(page, _FIRST_NAME_SELECTORS, timeout=3000)
+                await first_name_input.click()
+                await first_name_input.fill(first_name)
+            except ElementNotFoundError:
+                pass
 
             # Last name (if provided)
             if last_name:
-                last_name_selectors = [
-                    'input[placeholder*="Last name" i]',
-                    'input[name*="last" i]',
-                ]
-
-                for selector in last_name_selectors:
-                    try:
-                        last_name_input = await wait_for_selector(page, selector, timeout=3000)
-                        await last_name_input.click()
-                        await last_name_input.fill(last_name)
-                        break
-                    except ElementNotFoundError:
-                        continue
-
-            # Phone number
-            phone_selectors = [
-                'input[type="tel"]',
-                'input[placeholder*="phone" i]',
-                'input[name*="phone" i]',
-            ]
-
-            for selector in phone_selectors:
                 try:
-                    phone_input = await wait_for_selector(page, selector, timeout=3000)
-                    await phone_input.click()
-                    await phone_input.fill(phone)
-                    break
+                    _, last_name_input = await wait_for_any_selector(page, _LAST_NAME_SELECTORS, timeout=3000)
+                    await last_name_input.click()
+                    await last_name_input.fill(last_name)
                 except ElementNotFoundError:
-                    continue
+                    pass
+
+            # Phone number
+            try:
+                _, phone_input = await wait_for_any_selector(page, _PHONE_SELECTORS, timeout=3000)
+                await phone_input.click()
+                await phone_input.fill(phone)
+            except ElementNotFoundError:
+                pass
 
             await page.wait_for_timeout(500)
 
             # Click Save/Add button
-            save_selectors = [
-                'button:has-text("Save")',
-                'button:has-text("Add")',
-                'button:has-text("Create")',
-                'button[type="submit"]',
-            ]
-
-            for selector in save_selectors:
+            for selector in _SAVE_SELECTORS:
                 try:
                     if await safe_click(page, selector, timeout=3000):
                         await page.wait_for_timeout(2000)
@@ -275,46 +259,25 @@ class ContactManager:
 
         try:
             # Use search functionality
-            search_selectors = [
-                'input[placeholder*="Search" i]',
-                'input[type="search"]',
-            ]
-
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = await wait_for_selector(page, selector, timeout=5000)
-                    break
-                except ElementNotFoundError:
-                    continue
-
-            if not search_input:
+            try:
+                _, search_input = await wait_for_any_selector(page, _SEARCH_SELECTORS, timeout=5000)
+            except ElementNotFoundError:
                 return None
 
             await search_input.click()
-            await search_input.fill("")
-            await search_input.type(phone, delay=100)
-            await page.wait_for_timeout(2000)
+            await search_input.fill(phone)
+            # Wait for search results, but only until the first one renders (at most the old 2s).
+            with contextlib.suppress(ElementNotFoundError):
+                await wait_for_any_selector(page, _RESULT_SELECTORS, timeout=2000)
 
             # Look for contact in results
-            result_selectors = [
-                '.search-result',
-                '.contact',
-                '.user-item',
-            ]
-
-            for selector in result_selectors:
-                try:
-                    results = await page.query_selector_all(selector)
-                    if results:
-                        # Try to extract contact info from first result
-                        first_result = results[0]
-                        text = await first_result.inner_text()
-                        return {"phone": phone, "name": text.strip()}
-                except Exception:
-                    continue
+            selector = await first_matching_selector(page, _RESULT_SELECTORS)
+            if not selector:
+                return None
 
-            return None
+            # Try to extract contact info from first result
+            text = await page.locator(selector).first.inner_text(timeout=5000)
+            return {"phone": phone, "name": text.strip()}
 
         except Exception as e:
             logger.error(f"Error searching contact: {e}")
@@ -2,30 +2,355 @@
 
 import asyncio
 import logging
+import re
 from typing import List, Optional, Union
 
-from playwright.async_api import Page
+from playwright.async_api import Error as PlaywrightError, Locator, Page, TimeoutError as PlaywrightTimeoutError
 
 from .browser import TelegramBrowser
 from .browser.browser_adapter import EnhancedBrowserAdapter
 from .telemetry import get_global_tracer
-from .utils import ElementNotFoundError, safe_click, wait_for_selector
+from .utils import extract_phone_number
 
 logger = logging.getLogger(__name__)
 
+_NUM_RE = re.compile(r"(\d+)")
+_URL_ID_RE = re.compile(r"/(\d+)/?$")
+
+# Pause after a click that swaps whole panels, so the slide animation can finish.
+_SETTLE_MS = 250
+
+# Elements that mark the end of a step; the next step waits for them instead of sleeping.
+_SEARCH_SELECTORS = ('input[placeholder*="Search" i]', 'input[type="search"]')
+_CONTACT_RESULT_SELECTORS = ('.contact', '.user-item', '.search-result')
+_GROUP_RESULT_SELECTORS = ('.chat-item', '.group-item', '.search-result')
+_GROUP_NAME_SELECTORS = (
+    'input[placeholder*="Group name" i]',
+    'input[placeholder*="Name" i]',
+    'input[type="text"]',
+)
+_CHAT_HEADER_SELECTORS = ('.chat-header', '.chat-info', '[data-testid="chat-header"]')
+_ADD_MEMBER_SELECTORS = (
+    'button:has-text("Add Members")',
+    'button:has-text("Add")',
+    'button[aria-label*="Add Member" i]',
+)
+_MEMBER_SECTION_SELECTORS = (
+    'button:has-text("Members")',
+    'div:has-text("Members")',
+    '[aria-label*="Members" i]',
+)
+_NEW_GROUP_SELECTORS = (
+    'button:has-text("New Group")',
+    'button[aria-label*="New Group" i]',
+    'button[aria-label*="Create Group" i]',
+    '.new-group-button',
+    '[data-testid="new-group"]',
+)
+_NEXT_SELECTORS = (
+    'button:has-text("Next")',
+    'button:has-text("Continue")',
+    'button[aria-label*="Next" i]',
+)
+_CREATE_SELECTORS = (
+    'button:has-text("Create")',
+    'button:has-text("Create Group")',
+    'button[type="submit"]',
+)
+_INFO_SELECTORS = (
+    'button[aria-label*="Group Info" i]',
+    'button[aria-label*="Info" i]',
+    '.group-info-button',
+)
+_DONE_SELECTORS = (
+    'button:has-text("Done")',
+    'button:has-text("Add")',
+    'button:has-text("Add Members")',
+)
+_REMOVE_SELECTORS = (
+    'button:has-text("Remove")',
+    'button:has-text("Remove from Group")',
+    'button:has-text("Delete")',
+    'button[aria-label*="Remove" i]',
+    'button[aria-label*="Delete" i]',
+    '.remove-member',
+)
+_CONFIRM_SELECTORS = (
+    'button:has-text("Remove")',
+    'button:has-text("Delete")',
+    'button:has-text("Confirm")',
+    'button:has-text("Yes")',
+    'button[type="submit"]',
+)
+_MEMBER_ITEM_SELECTORS = (
+    '.member-item',
+    '.user-item',
+    '.contact-item',
+    '[data-testid="member-item"]',
+)
+_MEMBER_MENU_SELECTOR = 'button[aria-label*="Menu" i], button[aria-label*="More" i], .menu-button'
+
+# Non-empty, trimmed texts of the chat items under a chat list element.
+_CHAT_ITEM_NAMES_JS = """(root) => Array.from(root.querySelectorAll('.chat-item, .group-item'))
+    .map((e) => (e.innerText || '').trim())
+    .filter(Boolean)"""
+
+# Candidates per group-info field, in priority order. "css" may be narrowed by "text"
+# (case-insensitive substring, like Playwright's :has-text); "pattern" matches a text node.
+_GROUP_INFO_FIELDS = {
+    "member_count": (
+        {"pattern": r"\d+\s+members?"},
+        {"pattern": r"\d+\s+participants?"},
+        {"css": '[aria-label*="members" i]'},
+        {"css": ".member-count"},
+    ),
+    "members_button": (
+        {"css": "button", "text": "Members"},
+        {"css": "a", "text": "Members"},
+        {"css": '[aria-label*="Members" i]'},
+    ),
+    "description": (
+        {"css": ".group-description"},
+        {"css": ".description"},
+        {"css": '[aria-label*="Description" i]'},
+        {"css": "div", "text": "Description"},
+    ),
+    "admin_count": (
+        {"pattern": r"\d+\s+admins?"},
+        {"css": '[aria-label*="admin" i]'},
+        {"css": ".admin-count"},
+    ),
+    "photo": (
+        {"css": ".group-photo"},
+        {"css": ".avatar"},
+        {"css": '[aria-label*="group photo" i]'},
+    ),
+    "username": (
+        {"css": 'input[value*="@"]'},
+        {"css": ".username"},
+        {"css": '[aria-label*="username" i]'},
+    ),
+}
+
+# Resolves _GROUP_INFO_FIELDS to {field: [first match per candidate or null]}, plus
+# "type_hint": the chat's peer/chat type attribute if Telegram sets one, otherwise the
+# start of the chat info panel's text (rather than shipping page.content() over CDP).
+_GROUP_INFO_JS = """(fields) => {
+    const textOf = (el) => el.getAttribute('value') || el.innerText || '';
+    const probe = (c) => {
+        if (c.pattern) {
+            const re = new RegExp(c.pattern, 'i');
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+            for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+                if (re.test(n.nodeValue)) return n.nodeValue;
+            }
+            return null;
+        }
+        let els;
+        try { els = document.querySelectorAll(c.css); } catch (e) { return null; }
+        const needle = c.text && c.text.toLowerCase();
+        for (const el of els) {
+            if (!needle || (el.textContent || '').toLowerCase().includes(needle)) return textOf(el);
+        }
+        return null;
+    };
+    const out = {};
+    for (const [field, candidates] of Object.entries(fields)) out[field] = candidates.map(probe);
+    const el = document.querySelector('[data-peer-type], [data-chat-type], .chat-info');
+    out.type_hint = !el ? '' : (el.getAttribute('data-peer-type') || el.getAttribute('data-chat-type')
+        || (el.textContent || '').slice(0, 200));
+    return out;
+}"""
+
+
+async def _await_next(page: Page, selectors: tuple[str, ...], timeout: int = 5000) -> bool:
+    """
+    Wait until any of `selectors` is visible, i.e. the UI is ready for the next step.
+
+    Args:
+        page: Playwright page object
+        selectors: Selectors (Playwright CSS, :has-text allowed) marking the next step
+        timeout: Maximum time to wait in milliseconds
+
+    Returns:
+        True if one became visible, False on timeout (the caller carries on either way,
+        as it did after the fixed sleeps this replaces)
+    """
+    try:
+        await page.wait_for_selector(", ".join(selectors), state="visible", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def _find_any(
+    page: Page, selectors: tuple[str, ...], timeout: int = 5000
+) -> Optional[tuple[str, Locator]]:
+    """
+    Wait once for any of `selectors`, then return the highest-priority visible match.
+
+    The union is resolved by the browser in one wait, so a missing candidate no longer
+    costs its own timeout; list order still decides between several visible matches.
+
+    Args:
+        page: Playwright page object
+        selectors: Candidate selectors, in priority order
+        timeout: Maximum time to wait in milliseconds
+
+    Returns:
+        Tuple of the matching selector and its Locator, or None if none became visible
+    """
+    if not await _await_next(page, selectors, timeout=timeout):
+        return None
+    for selector in selectors:
+        locator = page.locator(selector).first
+        if await locator.is_visible():
+            return selector, locator
+    return None
+
 
 class GroupManager:
     """Manages Telegram groups."""
 
-    def __init__(self, browser: Union[TelegramBrowser, EnhancedBrowserAdapter]):
+    def __init__(
+        self,
+        browser: Union[TelegramBrowser, EnhancedBrowserAdapter],
+        humanize: bool = False,
+    ):
         """
         Initialize group manager.
 
         Args:
             browser: TelegramBrowser instance
+            humanize: Type the group name key by key (100ms apart) instead of filling it;
+                search boxes are always filled
         """
         self.browser = browser
+        self.humanize = humanize
         self.tracer = get_global_tracer()
+        # Resolved once: a missing or disabled tracer skips building the trace details too.
+        self._traces_enabled = bool(self.tracer and getattr(self.tracer, "enabled", True))
+        # Winning selector per UI slot ("info_btn", "member_search", ...), tried first next time
+        self._selector_hits: dict[str, str] = {}
+        # Chat URL the hits were recorded on; reset when _open_group lands elsewhere
+        self._selector_hits_url: Optional[str] = None
+
+    async def _first_working(
+        self, page: Page, slot: str, selectors: tuple[str, ...], timeout: int = 5000
+    ) -> Optional[Locator]:
+        """
+        Find the element for a UI slot, trying the selector that matched last time first.
+
+        Args:
+            page: Playwright page object
+            slot: Logical name of the element the selectors describe
+            selectors: Candidate selectors, in priority order
+            timeout: Maximum time to wait in milliseconds
+
+        Returns:
+            Locator of the element, or None if none became visible
+        """
+        hit = self._selector_hits.get(slot)
+        if hit:
+            locator = page.locator(hit).first
+            if await locator.is_visible():
+                return locator
+
+        found = await _find_any(page, selectors, timeout=timeout)
+        if found is None:
+            return None
+        selector, locator = found
+        self._selector_hits[slot] = selector
+        return locator
+
+    async def _click_any(
+        self, page: Page, slot: str, selectors: tuple[str, ...], timeout: int = 5000
+    ) -> bool:
+        """
+        Click the element for a UI slot.
+
+        Args:
+            page: Playwright page object
+            slot: Logical name of the element the selectors describe
+            selectors: Candidate selectors, in priority order
+            timeout: Maximum time to wait in milliseconds
+
+        Returns:
+            True if an element was clicked
+        """
+        locator = await self._first_working(page, slot, selectors, timeout=timeout)
+        if locator is None:
+            return False
+        try:
+            await locator.click(timeout=timeout)
+            return True
+        except PlaywrightError:
+            # Detached, covered or disabled mid-click (not only timeouts): try the others.
+            failed = self._selector_hits.pop(slot, None)
+
+        for selector in selectors:
+            if selector == failed:
+                continue
+            candidate = page.locator(selector).first
+            try:
+                if await candidate.is_visible():
+                    await candidate.click(timeout=timeout)
+                    self._selector_hits[slot] = selector
+                    return True
+            except PlaywrightError:
+                continue
+        return False
+
+    async def _select_members(self, page: Page, phones: List[str]) -> None:
+        """
+        Pick contacts in an open member picker, one search per phone number.
+
+        Args:
+            page: Playwright page object
+            phones: Phone numbers to select
+        """
+        # Normalize up front, dropping duplicates that would toggle a contact off again.
+        normalized = list(dict.fromkeys(extract_phone_number(phone) for phone in phones))
+
+        # The picker has one search box, so the UI part stays sequential.
+        for phone in normalized:
+            search_input = await self._first_working(page, "member_search", _SEARCH_SELECTORS, timeout=3000)
+            if not search_input:
+                continue
+            # fill() waits for actionability and focuses the input: no separate click.
+            await search_input.fill(phone)
+            await _await_next(page, _CONTACT_RESULT_SELECTORS, timeout=3000)
+
+            # Click on the contact in results (already rendered, so no wait)
+            await self._click_any(page, "contact_result", _CONTACT_RESULT_SELECTORS, timeout=1000)
+
+    async def _open_member_menu(self, page: Page, digits: str, timeout: int = 3000) -> bool:
+        """
+        Open the context menu of the member list item showing a phone number.
+
+        Args:
+            page: Playwright page object
+            digits: Member's phone number without the leading "+", which also matches
+                items showing the "+" form
+            timeout: Maximum time to wait for the item in milliseconds
+
+        Returns:
+            True if the member was found and its menu opened
+        """
+        # Text matching runs in the browser.
+        target = page.locator(", ".join(_MEMBER_ITEM_SELECTORS)).filter(has_text=digits).first
+        try:
+            await target.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+
+        # Click the item's menu button, or right-click the item itself
+        menu_button = target.locator(_MEMBER_MENU_SELECTOR)
+        if await menu_button.count():
+            await menu_button.first.click()
+        else:
+            await target.click(button="right")
+        return True
 
     async def create_group(self, name: str, members: Optional[List[str]] = None) -> bool:
         """
@@ -38,7 +363,7 @@ class GroupManager:
         Returns:
             True if group created successfully
         """
-        if self.tracer:
+        if self._traces_enabled:
             self.tracer.log_operation("group", "create_group", status="started", details={"name": name, "members": members or []})
 
         page = self.browser.get_page()
@@ -46,133 +371,47 @@ class GroupManager:
         try:
             # Find "New Group" button
             # Common locations: sidebar, menu, or floating action button
-            new_group_selectors = [
-                'button:has-text("New Group")',
-                'button[aria-label*="New Group" i]',
-                'button[aria-label*="Create Group" i]',
-                '.new-group-button',
-                '[data-testid="new-group"]',
-            ]
-
-            group_clicked = False
-            for selector in new_group_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=5000):
-                        group_clicked = True
-                        await page.wait_for_timeout(2000)
-                        break
-                except Exception:
-                    continue
-
-            if not group_clicked:
+            if not await self._click_any(page, "new_group", _NEW_GROUP_SELECTORS, timeout=5000):
                 logger.error("Could not find New Group button")
                 return False
 
             # If members provided, select them
             if members:
-                for phone in members:
-                    # Search for contact by phone
-                    search_selectors = [
-                        'input[placeholder*="Search" i]',
-                        'input[type="search"]',
-                    ]
-
-                    search_input = None
-                    for selector in search_selectors:
-                        try:
-                            search_input = await wait_for_selector(page, selector, timeout=3000)
-                            break
-                        except ElementNotFoundError:
-                            continue
-
-                    if search_input:
-                        await search_input.click()
-                        await search_input.fill("")
-                        await search_input.type(phone, delay=100)
-                        await page.wait_for_timeout(1500)
-
-                        # Click on the contact in results
-                        result_selectors = [
-                            '.contact',
-                            '.user-item',
-                            '.search-result',
-                        ]
-
-                        for result_selector in result_selectors:
-                            try:
-                                results = await page.query_selector_all(result_selector)
-                                if results:
-                                    await results[0].click()
-                                    await page.wait_for_timeout(500)
-                                    break
-                            except Exception:
-                                continue
+                await self._select_members(page, members)
 
             # Click Next/Continue button
-            next_selectors = [
-                'button:has-text("Next")',
-                'button:has-text("Continue")',
-                'button[aria-label*="Next" i]',
-            ]
-
-            for selector in next_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(1000)
-                        break
-                except Exception:
-                    continue
+            await self._click_any(page, "next_btn", _NEXT_SELECTORS, timeout=3000)
 
             # Enter group name
-            name_selectors = [
-                'input[placeholder*="Group name" i]',
-                'input[placeholder*="Name" i]',
-                'input[type="text"]',
-            ]
-
-            name_input = None
-            for selector in name_selectors:
-                try:
-                    name_input = await wait_for_selector(page, selector, timeout=5000)
-                    break
-                except ElementNotFoundError:
-                    continue
-
+            name_input = await self._first_working(page, "name_input", _GROUP_NAME_SELECTORS, timeout=5000)
             if not name_input:
                 logger.error("Could not find group name input")
                 return False
 
-            await name_input.click()
-            await name_input.fill("")
-            await name_input.type(name, delay=100)
-            await page.wait_for_timeout(500)
+            if self.humanize:
+                # fill("") clears and focuses the input, so no click is needed before typing.
+                await name_input.fill("")
+                await name_input.type(name, delay=100)
+            else:
+                await name_input.fill(name)
 
             # Click Create button
-            create_selectors = [
-                'button:has-text("Create")',
-                'button:has-text("Create Group")',
-                'button[type="submit"]',
-            ]
-
-            for selector in create_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(3000)
-                        logger.info(f"Group created: {name}")
-                        if self.tracer:
-                            self.tracer.log_operation("group", "create_group", status="completed", details={"name": name, "members": members or []})
-                        return True
-                except Exception:
-                    continue
+            if await self._click_any(page, "create_btn", _CREATE_SELECTORS, timeout=3000):
+                # The new chat opens once Telegram has created the group.
+                await _await_next(page, _CHAT_HEADER_SELECTORS)
+                logger.info(f"Group created: {name}")
+                if self._traces_enabled:
+                    self.tracer.log_operation("group", "create_group", status="completed", details={"name": name, "members": members or []})
+                return True
 
             logger.warning("Could not find create button")
-            if self.tracer:
+            if self._traces_enabled:
                 self.tracer.log_error("group", "create_group", "Could not find create button")
             return False
 
         except Exception as e:
             logger.error(f"Error creating group: {e}")
-            if self.tracer:
+            if self._traces_enabled:
                 self.tracer.log_error("group", "create_group", str(e))
             return False
 
@@ -191,94 +430,22 @@ class GroupManager:
 
         try:
             # Find and open the group
-            if not await self._open_group(group_name):
+            if not await self._open_group(page, group_name):
                 logger.error(f"Could not open group: {group_name}")
                 return False
 
-            # Find group info/settings button
-            info_selectors = [
-                'button[aria-label*="Group Info" i]',
-                'button[aria-label*="Info" i]',
-                '.group-info-button',
-            ]
-
-            for selector in info_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(1000)
-                        break
-                except Exception:
-                    continue
-
-            # Find "Add Members" button
-            add_member_selectors = [
-                'button:has-text("Add Members")',
-                'button:has-text("Add")',
-                'button[aria-label*="Add Member" i]',
-            ]
-
-            for selector in add_member_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(1000)
-                        break
-                except Exception:
-                    continue
+            # Find group info/settings button, then "Add Members" (each click waits for its target)
+            await self._click_any(page, "info_btn", _INFO_SELECTORS, timeout=3000)
+            await self._click_any(page, "add_member_btn", _ADD_MEMBER_SELECTORS, timeout=3000)
 
             # Add each member
-            for phone in phone_numbers:
-                # Search for contact
-                search_selectors = [
-                    'input[placeholder*="Search" i]',
-                    'input[type="search"]',
-                ]
-
-                search_input = None
-                for selector in search_selectors:
-                    try:
-                        search_input = await wait_for_selector(page, selector, timeout=3000)
-                        break
-                    except ElementNotFoundError:
-                        continue
-
-                if search_input:
-                    await search_input.click()
-                    await search_input.fill("")
-                    await search_input.type(phone, delay=100)
-                    await page.wait_for_timeout(1500)
-
-                    # Click on contact
-                    result_selectors = [
-                        '.contact',
-                        '.user-item',
-                        '.search-result',
-                    ]
-
-                    for result_selector in result_selectors:
-                        try:
-                            results = await page.query_selector_all(result_selector)
-                            if results:
-                                await results[0].click()
-                                await page.wait_for_timeout(500)
-                                break
-                        except Exception:
-                            continue
+            await self._select_members(page, phone_numbers)
 
             # Click Done/Add button
-            done_selectors = [
-                'button:has-text("Done")',
-                'button:has-text("Add")',
-                'button:has-text("Add Members")',
-            ]
-
-            for selector in done_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(2000)
-                        logger.info(f"Members added to group: {group_name}")
-                        return True
-                except Exception:
-                    continue
+            if await self._click_any(page, "done_btn", _DONE_SELECTORS, timeout=3000):
+                await page.wait_for_timeout(_SETTLE_MS)
+                logger.info(f"Members added to group: {group_name}")
+                return True
 
             return False
 
@@ -297,196 +464,71 @@ class GroupManager:
         Returns:
             True if member removed successfully
         """
-        if self.tracer:
+        if self._traces_enabled:
             self.tracer.log_operation("group", "remove_member_from_group", status="started", details={"group_name": group_name, "phone_number": phone_number})
 
         page = self.browser.get_page()
+        # Canonical "+digits" form, and the digits matched against member items, computed once
+        phone_number = extract_phone_number(phone_number)
+        digits = phone_number.lstrip("+")
 
         try:
             # Open group
-            if not await self._open_group(group_name):
-                if self.tracer:
+            if not await self._open_group(page, group_name):
+                if self._traces_enabled:
                     self.tracer.log_error("group", "remove_member_from_group", f"Could not open group: {group_name}")
                 return False
 
             # Open group info
-            info_selectors = [
-                'button[aria-label*="Group Info" i]',
-                'button[aria-label*="Info" i]',
-                '.group-info-button',
-            ]
-
-            info_opened = False
-            for selector in info_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(1500)
-                        info_opened = True
-                        break
-                except Exception:
-                    continue
-
-            if not info_opened:
+            if not await self._click_any(page, "info_btn", _INFO_SELECTORS, timeout=3000):
                 logger.error("Could not open group info")
-                if self.tracer:
+                if self._traces_enabled:
                     self.tracer.log_error("group", "remove_member_from_group", "Could not open group info")
                 return False
 
             # Look for "Members" section or member list
             # Scroll to find members section if needed
-            member_section_selectors = [
-                'button:has-text("Members")',
-                'div:has-text("Members")',
-                '[aria-label*="Members" i]',
-            ]
-
-            for selector in member_section_selectors:
-                try:
-                    member_section = await wait_for_selector(page, selector, timeout=3000)
-                    if member_section:
-                        await member_section.click()
-                        await page.wait_for_timeout(1000)
-                        break
-                except ElementNotFoundError:
-                    continue
+            await self._click_any(page, "member_section", _MEMBER_SECTION_SELECTORS, timeout=3000)
 
             # Wait for member list to load
-            await page.wait_for_timeout(1000)
+            await _await_next(page, _MEMBER_ITEM_SELECTORS, timeout=3000)
 
             # Search for member by phone number in the member list
-            # Try to find member item that contains the phone number
-            member_item_selectors = [
-                '.member-item',
-                '.user-item',
-                '.contact-item',
-                '[data-testid="member-item"]',
-            ]
-
-            member_found = False
-            for selector in member_item_selectors:
-                try:
-                    member_items = await page.query_selector_all(selector)
-                    for item in member_items:
-                        try:
-                            text = await item.inner_text()
-                            # Check if phone number appears in the member item text
-                            if phone_number in text or phone_number.replace("+", "") in text:
-                                # Right-click or click menu button on member item
-                                # Try to find menu button within the member item
-                                menu_button = await item.query_selector('button[aria-label*="Menu" i], button[aria-label*="More" i], .menu-button')
-                                if menu_button:
-                                    await menu_button.click()
-                                    await page.wait_for_timeout(500)
-                                else:
-                                    # Right-click on the item
-                                    await item.click(button="right")
-                                    await page.wait_for_timeout(500)
-                                
-                                member_found = True
-                                break
-                        except Exception:
-                            continue
-                    
-                    if member_found:
-                        break
-                except Exception:
-                    continue
+            # (the list is already rendered, so only a short wait)
+            member_found = await self._open_member_menu(page, digits, timeout=1000)
 
             # Alternative: Search for member using search input in members list
             if not member_found:
-                search_selectors = [
-                    'input[placeholder*="Search" i]',
-                    'input[type="search"]',
-                ]
-
-                for selector in search_selectors:
-                    try:
-                        search_input = await wait_for_selector(page, selector, timeout=3000)
-                        if search_input:
-                            await search_input.click()
-                            await search_input.fill("")
-                            await search_input.type(phone_number, delay=100)
-                            await page.wait_for_timeout(1500)
-                            
-                            # Find the member in search results
-                            result_items = await page.query_selector_all('.member-item, .user-item, .contact-item')
-                            for item in result_items:
-                                try:
-                                    text = await item.inner_text()
-                                    if phone_number in text or phone_number.replace("+", "") in text:
-                                        # Click menu button
-                                        menu_button = await item.query_selector('button[aria-label*="Menu" i], button[aria-label*="More" i]')
-                                        if menu_button:
-                                            await menu_button.click()
-                                            await page.wait_for_timeout(500)
-                                        else:
-                                            await item.click(button="right")
-                                            await page.wait_for_timeout(500)
-                                        member_found = True
-                                        break
-                                except Exception:
-                                    continue
-                            break
-                    except ElementNotFoundError:
-                        continue
+                search_input = await self._first_working(page, "member_search", _SEARCH_SELECTORS, timeout=3000)
+                if search_input:
+                    await search_input.fill(phone_number)
+                    member_found = await self._open_member_menu(page, digits, timeout=3000)
 
             if not member_found:
                 logger.error(f"Could not find member with phone number: {phone_number}")
-                if self.tracer:
+                if self._traces_enabled:
                     self.tracer.log_error("group", "remove_member_from_group", f"Member not found: {phone_number}")
                 return False
 
             # Look for remove/delete option in context menu
-            remove_selectors = [
-                'button:has-text("Remove")',
-                'button:has-text("Remove from Group")',
-                'button:has-text("Delete")',
-                'button[aria-label*="Remove" i]',
-                'button[aria-label*="Delete" i]',
-                '.remove-member',
-            ]
-
-            remove_clicked = False
-            for selector in remove_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(1000)
-                        remove_clicked = True
-                        break
-                except Exception:
-                    continue
-
-            if not remove_clicked:
+            if not await self._click_any(page, "remove_btn", _REMOVE_SELECTORS, timeout=3000):
                 logger.error("Could not find remove button")
-                if self.tracer:
+                if self._traces_enabled:
                     self.tracer.log_error("group", "remove_member_from_group", "Could not find remove button")
                 return False
 
             # Check for confirmation dialog
-            confirm_selectors = [
-                'button:has-text("Remove")',
-                'button:has-text("Delete")',
-                'button:has-text("Confirm")',
-                'button:has-text("Yes")',
-                'button[type="submit"]',
-            ]
-
-            for selector in confirm_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(2000)
-                        break
-                except Exception:
-                    continue
+            if await self._click_any(page, "confirm_btn", _CONFIRM_SELECTORS, timeout=3000):
+                await page.wait_for_timeout(_SETTLE_MS)
 
             logger.info(f"Member {phone_number} removed from group: {group_name}")
-            if self.tracer:
+            if self._traces_enabled:
                 self.tracer.log_operation("group", "remove_member_from_group", status="completed", details={"group_name": group_name, "phone_number": phone_number})
             return True
 
         except Exception as e:
             logger.error(f"Error removing member from group: {e}")
-            if self.tracer:
+            if self._traces_enabled:
                 self.tracer.log_error("group", "remove_member_from_group", str(e))
             return False
 
@@ -503,169 +545,67 @@ class GroupManager:
         page = self.browser.get_page()
 
         try:
-            if not await self._open_group(group_name):
+            if not await self._open_group(page, group_name):
                 return None
 
             # Open group info
-            info_selectors = [
-                'button[aria-label*="Group Info" i]',
-                'button[aria-label*="Info" i]',
-                '.group-info-button',
-            ]
-
-            info_opened = False
-            for selector in info_selectors:
-                try:
-                    if await safe_click(page, selector, timeout=3000):
-                        await page.wait_for_timeout(1500)
-                        info_opened = True
-                        break
-                except Exception:
-                    continue
-
-            if not info_opened:
+            if not await self._click_any(page, "info_btn", _INFO_SELECTORS, timeout=3000):
                 logger.warning("Could not open group info, returning basic info")
                 return {"name": group_name}
+            await _await_next(page, _MEMBER_SECTION_SELECTORS, timeout=3000)
 
             # Initialize info dictionary
             info = {"name": group_name}
 
-            # Extract member count
-            member_count_selectors = [
-                'text=/\\d+\\s+members?/i',
-                'text=/\\d+\\s+participants?/i',
-                '[aria-label*="members" i]',
-                '.member-count',
-            ]
-
-            for selector in member_count_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.inner_text()
-                        # Extract number from text like "123 members" or "123 participants"
-                        import re
-                        match = re.search(r'(\d+)', text)
-                        if match:
-                            info["member_count"] = int(match.group(1))
-                            break
-                except Exception:
-                    continue
-
-            # Try to get member count from Members button/link
-            if "member_count" not in info:
-                members_button_selectors = [
-                    'button:has-text("Members")',
-                    'a:has-text("Members")',
-                    '[aria-label*="Members" i]',
-                ]
-
-                for selector in members_button_selectors:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            text = await element.inner_text()
-                            import re
-                            match = re.search(r'(\d+)', text)
-                            if match:
-                                info["member_count"] = int(match.group(1))
-                                break
-                    except Exception:
-                        continue
+            # Every field is probed in the page in one round-trip; each candidate yields
+            # its first match (or None), and the checks below pick among them in order.
+            raw = await page.evaluate(_GROUP_INFO_JS, _GROUP_INFO_FIELDS)
+
+            # Extract member count from text like "123 members" or "123 participants",
+            # falling back to the Members button/link
+            for text in raw["member_count"] + raw["members_button"]:
+                match = _NUM_RE.search(text) if text else None
+                if match:
+                    info["member_count"] = int(match.group(1))
+                    break
 
             # Extract description
-            description_selectors = [
-                '.group-description',
-                '.description',
-                '[aria-label*="Description" i]',
-                'div:has-text("Description")',
-            ]
-
-            for selector in description_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        description = await element.inner_text()
-                        if description and description.strip():
-                            info["description"] = description.strip()
-                            break
-                except Exception:
-                    continue
+            for description in raw["description"]:
+                if description and description.strip():
+                    info["description"] = description.strip()
+                    break
 
             # Extract group type (group, supergroup, channel)
-            # Check for indicators in the UI
-            page_content = await page.content()
-            if "supergroup" in page_content.lower() or "super group" in page_content.lower():
+            type_hint = raw["type_hint"].lower()
+            if "supergroup" in type_hint or "super group" in type_hint:
                 info["type"] = "supergroup"
-            elif "channel" in page_content.lower():
+            elif "channel" in type_hint:
                 info["type"] = "channel"
             else:
                 info["type"] = "group"
 
-            # Try to extract admin count or admin list
-            admin_selectors = [
-                'text=/\\d+\\s+admins?/i',
-                '[aria-label*="admin" i]',
-                '.admin-count',
-            ]
-
-            for selector in admin_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.inner_text()
-                        import re
-                        match = re.search(r'(\d+)', text)
-                        if match:
-                            info["admin_count"] = int(match.group(1))
-                            break
-                except Exception:
-                    continue
-
-            # Try to get group photo/avatar indicator
-            photo_selectors = [
-                '.group-photo',
-                '.avatar',
-                '[aria-label*="group photo" i]',
-            ]
-
-            for selector in photo_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        info["has_photo"] = True
-                        break
-                except Exception:
-                    continue
-
-            if "has_photo" not in info:
-                info["has_photo"] = False
+            # Try to extract admin count
+            for text in raw["admin_count"]:
+                match = _NUM_RE.search(text) if text else None
+                if match:
+                    info["admin_count"] = int(match.group(1))
+                    break
+
+            # Group photo/avatar indicator
+            info["has_photo"] = any(found is not None for found in raw["photo"])
 
             # Extract username if it's a public group/channel
-            username_selectors = [
-                'input[value*="@"]',
-                '.username',
-                '[aria-label*="username" i]',
-            ]
-
-            for selector in username_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        value = await element.get_attribute("value") or await element.inner_text()
-                        if value and "@" in value:
-                            info["username"] = value.strip()
-                            break
-                except Exception:
-                    continue
+            for value in raw["username"]:
+                if value and "@" in value:
+                    info["username"] = value.strip()
+                    break
 
             # Get current URL which might contain group ID
             current_url = page.url
             if current_url:
                 info["url"] = current_url
                 # Try to extract group ID from URL
-                import re
-                match = re.search(r'/(\d+)/?$', current_url)
+                match = _URL_ID_RE.search(current_url)
                 if match:
                     info["group_id"] = match.group(1)
 
@@ -687,27 +627,18 @@ class GroupManager:
 
         try:
             # Find chat list or group list
-            chat_list_selectors = [
+            chat_list_selectors = (
                 '.chat-list',
                 '[data-testid="chat-list"]',
                 '.sidebar',
-            ]
+            )
 
             groups = []
-            for selector in chat_list_selectors:
-                try:
-                    chat_list = await wait_for_selector(page, selector, timeout=5000)
-                    if chat_list:
-                        # Extract group names from chat list
-                        # This depends on Telegram Web UI structure
-                        items = await chat_list.query_selector_all('.chat-item, .group-item')
-                        for item in items:
-                            text = await item.inner_text()
-                            if text:
-                                groups.append(text.strip())
-                        break
-                except ElementNotFoundError:
-                    continue
+            chat_list = await self._first_working(page, "chat_list", chat_list_selectors, timeout=5000)
+            if chat_list:
+                # Extract group names from chat list (trimmed and filtered in the page)
+                # This depends on Telegram Web UI structure
+                groups = await chat_list.evaluate(_CHAT_ITEM_NAMES_JS)
 
             return groups
 
@@ -715,61 +646,42 @@ class GroupManager:
             logger.error(f"Error listing groups: {e}")
             return []
 
-    async def _open_group(self, group_name: str) -> bool:
+    async def _open_group(self, page: Page, group_name: str) -> bool:
         """
         Open a group by name.
 
         Args:
+            page: Page of the calling public method
             group_name: Name of the group
 
         Returns:
             True if group opened successfully
         """
-        page = self.browser.get_page()
-
         try:
             # Search for group
-            search_selectors = [
-                'input[placeholder*="Search" i]',
-                'input[type="search"]',
-            ]
-
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = await wait_for_selector(page, selector, timeout=5000)
-                    break
-                except ElementNotFoundError:
-                    continue
-
+            search_input = await self._first_working(page, "group_search", _SEARCH_SELECTORS, timeout=5000)
             if not search_input:
                 return False
 
-            await search_input.click()
-            await search_input.fill("")
-            await search_input.type(group_name, delay=100)
-            await page.wait_for_timeout(2000)
-
-            # Click on group in results
-            result_selectors = [
-                '.chat-item',
-                '.group-item',
-                '.search-result',
-            ]
-
-            for result_selector in result_selectors:
-                try:
-                    results = await page.query_selector_all(result_selector)
-                    for result in results:
-                        text = await result.inner_text()
-                        if group_name.lower() in text.lower():
-                            await result.click()
-                            await page.wait_for_timeout(2000)
-                            return True
-                except Exception:
-                    continue
+            await search_input.fill(group_name)
 
-            return False
+            # Click on group in results; the case-insensitive name match runs in the browser
+            # and click() waits for the result to render.
+            result = (
+                page.locator(", ".join(_GROUP_RESULT_SELECTORS)).filter(has_text=group_name).first
+            )
+            try:
+                await result.click(timeout=5000)
+            except PlaywrightTimeoutError:
+                return False
+
+            await _await_next(page, _CHAT_HEADER_SELECTORS, timeout=3000)
+            await page.wait_for_timeout(_SETTLE_MS)
+            if page.url != self._selector_hits_url:
+                # Another chat: its panels may be laid out differently.
+                self._selector_hits.clear()
+                self._selector_hits_url = page.url
+            return True
 
         except Exception as e:
             logger.error(f"Error opening group: {e}")
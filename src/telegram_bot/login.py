@@ -2,33 +2,254 @@
 
 import asyncio
 import logging
+import sys
 from typing import Optional, Union
 
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 
 from .browser import TelegramBrowser
 from .browser.browser_adapter import EnhancedBrowserAdapter
 from .session import SessionManager
 from .telemetry import get_global_tracer
-from .utils import ElementNotFoundError, LoginError, SessionExpiredError, safe_click, wait_for_selector
+from .utils import ElementNotFoundError, LoginError, SessionExpiredError, race_selectors
 
 logger = logging.getLogger(__name__)
 
+# Selector candidates per login step. Each set is waited on as one CSS union, so a
+# missing candidate costs nothing instead of its own timeout.
+_LOGIN_PAGE_SELECTORS = (
+    'input[type="tel"]',  # Phone input
+    'input[placeholder*="phone"]',  # Phone input by placeholder
+    'input[placeholder*="Phone"]',  # Phone input by placeholder
+    'button:has-text("Next")',  # Next button
+    'button:has-text("Continue")',  # Continue button
+)
+_PHONE_SELECTORS = (
+    'input[type="tel"]',
+    'input[placeholder*="phone" i]',
+    'input[placeholder*="Phone" i]',
+    'input[name*="phone" i]',
+)
+_OTP_SELECTORS = (
+    'input[type="tel"]',
+    'input[placeholder*="code" i]',
+    'input[placeholder*="Code" i]',
+    'input[name*="code" i]',
+    'input[inputmode="numeric"]',
+)
+_PASSWORD_SELECTORS = (
+    'input[type="password"]',
+    'input[placeholder*="password" i]',
+    'input[placeholder*="Password" i]',
+)
+# Indicators that we're logged in; these may need updating with Telegram Web UI changes
+_LOGGED_IN_SELECTORS = (
+    '[data-testid="chat-list"]',  # Chat list
+    '.chat-list',  # Chat list class
+    '[aria-label*="Chat" i]',  # Chat elements
+    'input[placeholder*="Search" i]',  # Search input
+    'button[aria-label*="Menu" i]',  # Menu button
+    '.sidebar',  # Sidebar
+)
+_STILL_ON_LOGIN_SELECTORS = (
+    'input[type="tel"]',
+    'input[placeholder*="phone" i]',
+    'button:has-text("Log in")',
+)
+
+# The unions are joined once here rather than on every wait.
+_LOGIN_PAGE_UNION = ", ".join(_LOGIN_PAGE_SELECTORS)
+_PHONE_UNION = ", ".join(_PHONE_SELECTORS)
+_OTP_UNION = ", ".join(_OTP_SELECTORS)
+_PASSWORD_UNION = ", ".join(_PASSWORD_SELECTORS)
+_LOGGED_IN_UNION = ", ".join(_LOGGED_IN_SELECTORS)
+_STILL_ON_LOGIN_UNION = ", ".join(_STILL_ON_LOGIN_SELECTORS)
+# What can follow a submitted OTP: the 2FA password prompt or the logged-in UI
+_OTP_OUTCOME_UNION = f"{_PASSWORD_UNION}, {_LOGGED_IN_UNION}"
+# Rejected 2FA password: the field is flagged or an error message is shown
+_PASSWORD_ERROR_SELECTORS = (
+    'input[type="password"].error',
+    '.input-field.error',
+    ':text-matches("(incorrect|invalid|wrong) password", "i")',
+)
+# What can follow a submitted 2FA password: the logged-in UI or a password error
+_PASSWORD_OUTCOME_UNION = f"{_LOGGED_IN_UNION}, {', '.join(_PASSWORD_ERROR_SELECTORS)}"
+
+# Submit buttons, tried in order, after each form field
+_PHONE_SUBMIT_SELECTORS = (
+    'button:has-text("Next")',
+    'button:has-text("Continue")',
+    'button[type="submit"]',
+    'button.button-primary',
+)
+_OTP_SUBMIT_SELECTORS = (
+    'button:has-text("Next")',
+    'button:has-text("Sign In")',
+    'button:has-text("Continue")',
+    'button[type="submit"]',
+)
+_PASSWORD_SUBMIT_SELECTORS = (
+    'button:has-text("Next")',
+    'button:has-text("Sign In")',
+    'button[type="submit"]',
+)
+
+
+async def _wait_for_any(locator: Locator, timeout: int) -> Optional[Locator]:
+    """
+    Wait until a first-visible union locator (see TelegramLogin._visible) matches.
+
+    Args:
+        locator: Locator of the first visible match of a selector union
+        timeout: Maximum time to wait in milliseconds
+
+    Returns:
+        The locator once visible, or None on timeout
+    """
+    try:
+        await locator.wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        return None
+    return locator
+
+
+# In-page predicates on the input element, re-evaluated by wait_for_function as it changes
+_OTP_ENTERED_JS = "(el) => !!el && !!el.value && el.value.length >= 4"
+_PASSWORD_ENTERED_JS = "(el) => !!el && !!el.value"
+
+
+async def _log_wait_progress(what: str, max_wait_time: int) -> None:
+    """Log the remaining time every 30 seconds until cancelled."""
+    for elapsed in range(30, max_wait_time, 30):
+        await asyncio.sleep(30)
+        logger.info("Waiting for %s... (%d seconds remaining)", what, max_wait_time - elapsed)
+
+
+async def _wait_for_value(
+    page: Page,
+    field: Locator,
+    predicate: str,
+    what: str,
+    max_wait_time: int,
+    report_progress: bool = False,
+) -> bool:
+    """
+    Wait until the user has typed into `field`, as judged by the JS `predicate`.
+
+    Args:
+        page: Playwright page object
+        field: Input the user types into
+        predicate: JS function of the input element returning true once it is filled
+        what: Name of the awaited value for progress output
+        max_wait_time: Maximum time to wait in seconds
+        report_progress: Log the remaining time every 30 seconds while waiting
+
+    Returns:
+        True if the value was entered in time
+    """
+    handle = await field.element_handle()
+    progress = (
+        asyncio.create_task(_log_wait_progress(what, max_wait_time)) if report_progress else None
+    )
+    try:
+        await page.wait_for_function(predicate, arg=handle, timeout=max_wait_time * 1000)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+    finally:
+        if progress:
+            progress.cancel()
+        await handle.dispose()
+
+
+async def _click_first(page: Page, selectors: tuple[str, ...], timeout: int) -> bool:
+    """
+    Click whichever of `selectors` becomes visible first.
+
+    Args:
+        page: Playwright page object
+        selectors: Candidate selectors, in priority order
+        timeout: Maximum time to wait in milliseconds
+
+    Returns:
+        True if an element was clicked
+    """
+    try:
+        _, element = await race_selectors(page, selectors, timeout=timeout)
+    except ElementNotFoundError:
+        return False
+    await element.click()
+    return True
+
 
 class TelegramLogin:
     """Handles Telegram Web login flow."""
 
-    def __init__(self, browser: Union[TelegramBrowser, EnhancedBrowserAdapter], session_manager: SessionManager):
+    def __init__(
+        self,
+        browser: Union[TelegramBrowser, EnhancedBrowserAdapter],
+        session_manager: SessionManager,
+        typing_delay: int = 0,
+        verbose: bool = False,
+    ):
         """
         Initialize login handler.
 
         Args:
             browser: TelegramBrowser instance
             session_manager: SessionManager instance
+            typing_delay: Milliseconds between keystrokes when entering the phone, OTP and
+                password. 0 (default) fills each field in one step; a delay mimics human
+                typing at the cost of delay x length per field.
+            verbose: Show OTP/2FA prompts and wait progress on the console. Only takes
+                effect when stdout is a terminal, so servers never write to it.
         """
         self.browser = browser
         self.session_manager = session_manager
+        self.typing_delay = typing_delay
+        self.interactive = verbose and sys.stdout.isatty()
         self.tracer = get_global_tracer()
+        # Page resolved once per login flow; helpers called on their own resolve it per call
+        self._page: Optional[Page] = None
+        # Union locators built for `_locator_page`, keyed by selector union
+        self._locator_page: Optional[Page] = None
+        self._locators: dict[str, Locator] = {}
+
+    def _get_page(self) -> Page:
+        """Return the page of the running login flow, or the browser's current page."""
+        if self._page is not None:
+            return self._page
+        return self.browser.get_page()
+
+    def _visible(self, page: Page, union: str) -> Locator:
+        """
+        Locator of the first visible element matching a selector union, cached per page.
+
+        Locators are resolved anew on every action, so a cached one stays valid across
+        navigations; only a different page (e.g. after load_context) needs new ones.
+        """
+        if page is not self._locator_page:
+            self._locator_page = page
+            self._locators = {}
+        locator = self._locators.get(union)
+        if locator is None:
+            locator = self._locators[union] = page.locator(union).locator("visible=true").first
+        return locator
+
+    def _prompt(self, message: str) -> None:
+        """Show a prompt for the user on an interactive console."""
+        if self.interactive:
+            print("\n" + "=" * 50)
+            print(message)
+            print("=" * 50)
+
+    async def _enter_text(self, field: Locator, value: str) -> None:
+        """Replace the content of an input field with `value`."""
+        if self.typing_delay:
+            await field.fill("")
+            await field.type(value, delay=self.typing_delay)
+        else:
+            await field.fill(value)
 
     async def login_with_phone(
         self,
@@ -66,6 +287,7 @@ class TelegramLogin:
         # Start new login flow
         logger.info(f"Starting new login flow for {phone}")
         await self.browser.goto_telegram()
+        self._page = self.browser.get_page()
 
         try:
             # Wait for page to load and find login elements
@@ -81,19 +303,18 @@ class TelegramLogin:
                 return False
 
             otp = await self.wait_for_otp_input()
-            await self.enter_otp(otp)
-
-            # Check for 2FA password prompt
-            if await self._check_2fa_required():
-                logger.info("2FA password required")
+            verified = False
+            # enter_otp already probes for the 2FA password prompt
+            if await self.enter_otp(otp):
                 if self.tracer:
                     self.tracer.log_operation("login", "2fa_required", status="started", details={"phone": phone})
                 
                 # Wait for user to enter 2FA password
                 password = await self.wait_for_2fa_password()
                 
-                # Handle 2FA
+                # Handle 2FA; it already confirms the login, so it is not checked again below
                 if await self.handle_2fa(password):
+                    verified = True
                     logger.info("2FA successful")
                     if self.tracer:
                         self.tracer.log_operation("login", "2fa_completed", status="completed", details={"phone": phone})
@@ -104,10 +325,11 @@ class TelegramLogin:
                     raise LoginError(error_msg)
 
             # Check if login was successful
-            if await self.check_login_success():
+            if verified or await self.check_login_success():
                 # Save session
                 storage_state = await self.browser.get_storage_state()
-                self.session_manager.save_session(phone, storage_state)
+                # The JSON dump and write happen off the event loop
+                await asyncio.to_thread(self.session_manager.save_session, phone, storage_state)
                 logger.info(f"Login successful for {phone}")
                 if self.tracer:
                     self.tracer.log_operation("login", "login_with_phone", status="completed", details={"phone": phone, "used_saved_session": False})
@@ -123,6 +345,8 @@ class TelegramLogin:
             if self.tracer:
                 self.tracer.log_error("login", "login_with_phone", str(e))
             raise LoginError(f"Login failed: {e}") from e
+        finally:
+            self._page = None
 
     async def _try_saved_session(self, phone: str) -> bool:
         """
@@ -146,10 +370,8 @@ class TelegramLogin:
             # Load context with saved session
             await self.browser.load_context(storage_state)
             await self.browser.goto_telegram()
-
-            # Wait a bit for page to load
-            page = self.browser.get_page()
-            await page.wait_for_timeout(3000)
+            # load_context replaced the page, so resolve it only now
+            self._page = self.browser.get_page()
 
             # Check if we're logged in by looking for chat list or other logged-in indicators
             if await self.check_login_success():
@@ -161,39 +383,20 @@ class TelegramLogin:
         except Exception as e:
             logger.warning(f"Failed to use saved session: {e}")
             return False
+        finally:
+            self._page = None
 
     async def _wait_for_login_page(self) -> None:
         """Wait for login page to load."""
-        page = self.browser.get_page()
+        page = self._get_page()
 
         # Common selectors for Telegram Web login page
         # These may need to be updated if Telegram changes their UI
-        selectors = [
-            'input[type="tel"]',  # Phone input
-            'input[placeholder*="phone"]',  # Phone input by placeholder
-            'input[placeholder*="Phone"]',  # Phone input by placeholder
-            'button:has-text("Next")',  # Next button
-            'button:has-text("Continue")',  # Continue button
-        ]
-
-        found = False
-        for selector in selectors:
-            try:
-                await wait_for_selector(page, selector, timeout=10000)
-                found = True
-                break
-            except ElementNotFoundError:
-                continue
-
-        if not found:
+        if not await _wait_for_any(self._visible(page, _LOGIN_PAGE_UNION), timeout=10000):
             # Try to find any input field
-            try:
-                await wait_for_selector(page, "input", timeout=10000)
-            except ElementNotFoundError:
+            if not await _wait_for_any(self._visible(page, "input"), timeout=10000):
                 raise LoginError("Could not find login page elements")
 
-        await page.wait_for_timeout(1000)  # Additional wait for page stability
-
     async def enter_phone_number(self, phone: str) -> None:
         """
         Enter phone number in the login form.
@@ -201,54 +404,20 @@ class TelegramLogin:
         Args:
             phone: Phone number with country code
         """
-        page = self.browser.get_page()
+        page = self._get_page()
 
         # Find phone input field
-        selectors = [
-            'input[type="tel"]',
-            'input[placeholder*="phone" i]',
-            'input[placeholder*="Phone" i]',
-            'input[name*="phone" i]',
-        ]
-
-        phone_input = None
-        for selector in selectors:
-            try:
-                phone_input = await wait_for_selector(page, selector, timeout=5000)
-                break
-            except ElementNotFoundError:
-                continue
-
+        phone_input = await _wait_for_any(self._visible(page, _PHONE_UNION), timeout=5000)
         if not phone_input:
             raise LoginError("Could not find phone number input field")
 
         # Clear and enter phone number
-        await phone_input.click()
-        await phone_input.fill("")
-        await phone_input.type(phone, delay=100)  # Type with delay to mimic human
-        await page.wait_for_timeout(500)
+        await self._enter_text(phone_input, phone)
 
         # Find and click Next/Continue button
-        button_selectors = [
-            'button:has-text("Next")',
-            'button:has-text("Continue")',
-            'button[type="submit"]',
-            'button.button-primary',
-        ]
-
-        clicked = False
-        for selector in button_selectors:
-            try:
-                if await safe_click(page, selector, timeout=3000):
-                    clicked = True
-                    break
-            except Exception:
-                continue
-
-        if not clicked:
-            # Try pressing Enter
+        if not await _click_first(page, _PHONE_SUBMIT_SELECTORS, timeout=3000):
+            # Try pressing Enter (the OTP step waits for its input to appear)
             await phone_input.press("Enter")
-            await page.wait_for_timeout(1000)
 
         logger.info(f"Phone number entered: {phone}")
 
@@ -259,54 +428,26 @@ class TelegramLogin:
         Returns:
             OTP code entered by user
         """
-        page = self.browser.get_page()
+        page = self._get_page()
 
         # Wait for OTP input field to appear
-        selectors = [
-            'input[type="tel"]',
-            'input[placeholder*="code" i]',
-            'input[placeholder*="Code" i]',
-            'input[name*="code" i]',
-            'input[inputmode="numeric"]',
-        ]
-
-        otp_input = None
-        for selector in selectors:
-            try:
-                otp_input = await wait_for_selector(page, selector, timeout=30000)
-                break
-            except ElementNotFoundError:
-                continue
-
+        otp_input = await _wait_for_any(self._visible(page, _OTP_UNION), timeout=30000)
         if not otp_input:
             raise LoginError("OTP input field not found")
 
         logger.info("OTP input field found. Waiting for user to enter OTP...")
-        print("\n" + "=" * 50)
-        print("Please enter the OTP code you received:")
-        print("=" * 50)
+        self._prompt("Please enter the OTP code you received:")
 
-        # Wait for user to enter OTP
-        # We'll poll the input field value
+        # Wait for user to enter OTP (usually 5-6 digits); the check runs in the page
         max_wait_time = 300  # 5 minutes
-        check_interval = 1  # Check every second
-        elapsed = 0
-
-        while elapsed < max_wait_time:
-            value = await otp_input.input_value()
-            if value and len(value) >= 4:  # OTP is usually 5-6 digits
-                logger.info(f"OTP entered: {value}")
-                return value
-
-            await asyncio.sleep(check_interval)
-            elapsed += check_interval
+        if not await _wait_for_value(
+            page, otp_input, _OTP_ENTERED_JS, "OTP", max_wait_time, report_progress=self.interactive
+        ):
+            raise LoginError("Timeout waiting for OTP input")
 
-            # Print progress every 30 seconds
-            if elapsed % 30 == 0:
-                remaining = max_wait_time - elapsed
-                print(f"Waiting for OTP... ({remaining} seconds remaining)")
-
-        raise LoginError("Timeout waiting for OTP input")
+        value = await otp_input.input_value()
+        logger.info(f"OTP entered: {value}")
+        return value
 
     async def wait_for_otp_input_field(self) -> None:
         """Wait until the OTP input field is present.
@@ -315,99 +456,45 @@ class TelegramLogin:
         - `/auth/start` runs until OTP field is ready, then returns `waiting_for_otp`
         - client calls `/auth/submit-otp` to continue
         """
-        page = self.browser.get_page()
-
-        selectors = [
-            'input[type="tel"]',
-            'input[placeholder*="code" i]',
-            'input[placeholder*="Code" i]',
-            'input[name*="code" i]',
-            'input[inputmode="numeric"]',
-        ]
-
-        for selector in selectors:
-            try:
-                await wait_for_selector(page, selector, timeout=30000)
-                return
-            except ElementNotFoundError:
-                continue
-
-        raise LoginError("OTP input field not found")
-
-    async def enter_otp(self, otp: str) -> None:
+        page = self._get_page()
+
+        if not await _wait_for_any(self._visible(page, _OTP_UNION), timeout=30000):
+            raise LoginError("OTP input field not found")
+
+    async def enter_otp(self, otp: str) -> bool:
         """
         Enter OTP code.
 
         Args:
             otp: OTP code
+
+        Returns:
+            True if a 2FA password prompt appeared after submitting the code
         """
-        page = self.browser.get_page()
+        page = self._get_page()
 
         # Find OTP input field
-        selectors = [
-            'input[type="tel"]',
-            'input[placeholder*="code" i]',
-            'input[placeholder*="Code" i]',
-            'input[name*="code" i]',
-            'input[inputmode="numeric"]',
-        ]
-
-        otp_input = None
-        for selector in selectors:
-            try:
-                otp_input = await wait_for_selector(page, selector, timeout=5000)
-                break
-            except ElementNotFoundError:
-                continue
-
+        otp_input = await _wait_for_any(self._visible(page, _OTP_UNION), timeout=5000)
         if not otp_input:
             raise LoginError("Could not find OTP input field")
 
         # Enter OTP
-        await otp_input.click()
-        await otp_input.fill("")
-        await otp_input.type(otp, delay=100)
-        await page.wait_for_timeout(500)
+        await self._enter_text(otp_input, otp)
 
         # Try to submit (click button or press Enter)
-        button_selectors = [
-            'button:has-text("Next")',
-            'button:has-text("Sign In")',
-            'button:has-text("Continue")',
-            'button[type="submit"]',
-        ]
-
-        clicked = False
-        for selector in button_selectors:
-            try:
-                if await safe_click(page, selector, timeout=3000):
-                    clicked = True
-                    break
-            except Exception:
-                continue
-
-        if not clicked:
+        if not await _click_first(page, _OTP_SUBMIT_SELECTORS, timeout=3000):
             await otp_input.press("Enter")
 
         logger.info("OTP entered and submitted")
 
-        # Wait for login to process
-        await page.wait_for_timeout(3000)
-
-        # Check for 2FA password prompt
-        password_selectors = [
-            'input[type="password"]',
-            'input[placeholder*="password" i]',
-            'input[placeholder*="Password" i]',
-        ]
+        # Wait for login to process: either the 2FA prompt or the logged-in UI shows up
+        if await _wait_for_any(self._visible(page, _OTP_OUTCOME_UNION), timeout=6000):
+            # Check for 2FA password prompt
+            if await self._visible(page, _PASSWORD_UNION).is_visible():
+                logger.info("2FA password required")
+                return True
 
-        for selector in password_selectors:
-            try:
-                await wait_for_selector(page, selector, timeout=3000)
-                logger.warning("2FA password required. Please handle manually or implement 2FA handler.")
-                break
-            except ElementNotFoundError:
-                continue
+        return False
 
     async def check_login_success(self) -> bool:
         """
@@ -416,76 +503,23 @@ class TelegramLogin:
         Returns:
             True if logged in successfully
         """
-        page = self.browser.get_page()
-
-        # Wait a bit for page to load
-        await page.wait_for_timeout(2000)
+        page = self._get_page()
 
         # Look for indicators that we're logged in
-        # These selectors may need to be updated based on Telegram Web UI
-        logged_in_indicators = [
-            '[data-testid="chat-list"]',  # Chat list
-            '.chat-list',  # Chat list class
-            '[aria-label*="Chat" i]',  # Chat elements
-            'input[placeholder*="Search" i]',  # Search input
-            'button[aria-label*="Menu" i]',  # Menu button
-            '.sidebar',  # Sidebar
-        ]
-
-        for selector in logged_in_indicators:
-            try:
-                await wait_for_selector(page, selector, timeout=5000)
-                logger.info("Login success confirmed")
-                return True
-            except ElementNotFoundError:
-                continue
-
-        # Also check if we're still on login page
-        login_indicators = [
-            'input[type="tel"]',
-            'input[placeholder*="phone" i]',
-            'button:has-text("Log in")',
-        ]
-
-        for selector in login_indicators:
-            try:
-                await wait_for_selector(page, selector, timeout=2000)
-                logger.warning("Still on login page - login may have failed")
-                return False
-            except ElementNotFoundError:
-                continue
+        if await _wait_for_any(self._visible(page, _LOGGED_IN_UNION), timeout=5000):
+            logger.info("Login success confirmed")
+            return True
+
+        # Also check if we're still on login page. After the wait above the page has
+        # settled, so a single immediate check is enough.
+        if await self._visible(page, _STILL_ON_LOGIN_UNION).is_visible():
+            logger.warning("Still on login page - login may have failed")
+            return False
 
         # If we can't determine, assume success (page loaded)
         logger.warning("Could not definitively determine login status, assuming success")
         return True
 
-    async def _check_2fa_required(self) -> bool:
-        """
-        Check if 2FA password is required.
-
-        Returns:
-            True if 2FA password field is present
-        """
-        page = self.browser.get_page()
-        
-        # Wait a bit for page to update after OTP submission
-        await page.wait_for_timeout(2000)
-        
-        password_selectors = [
-            'input[type="password"]',
-            'input[placeholder*="password" i]',
-            'input[placeholder*="Password" i]',
-        ]
-
-        for selector in password_selectors:
-            try:
-                await wait_for_selector(page, selector, timeout=3000)
-                return True
-            except ElementNotFoundError:
-                continue
-        
-        return False
-
     async def wait_for_2fa_password(self) -> str:
         """
         Wait for user to enter 2FA password.
@@ -493,51 +527,30 @@ class TelegramLogin:
         Returns:
             2FA password entered by user
         """
-        page = self.browser.get_page()
+        page = self._get_page()
 
         # Find password input field
-        password_selectors = [
-            'input[type="password"]',
-            'input[placeholder*="password" i]',
-            'input[placeholder*="Password" i]',
-        ]
-
-        password_input = None
-        for selector in password_selectors:
-            try:
-                password_input = await wait_for_selector(page, selector, timeout=10000)
-                break
-            except ElementNotFoundError:
-                continue
-
+        password_input = await _wait_for_any(self._visible(page, _PASSWORD_UNION), timeout=10000)
         if not password_input:
             raise LoginError("2FA password input field not found")
 
         logger.info("2FA password input field found. Waiting for user to enter password...")
-        print("\n" + "=" * 50)
-        print("Please enter your 2FA password:")
-        print("=" * 50)
+        self._prompt("Please enter your 2FA password:")
 
         # Wait for user to enter password
         max_wait_time = 300  # 5 minutes
-        check_interval = 1  # Check every second
-        elapsed = 0
-
-        while elapsed < max_wait_time:
-            value = await password_input.input_value()
-            if value and len(value) >= 1:  # Password entered
-                logger.info("2FA password entered")
-                return value
-
-            await asyncio.sleep(check_interval)
-            elapsed += check_interval
-
-            # Print progress every 30 seconds
-            if elapsed % 30 == 0:
-                remaining = max_wait_time - elapsed
-                print(f"Waiting for 2FA password... ({remaining} seconds remaining)")
-
-        raise LoginError("Timeout waiting for 2FA password input")
+        if not await _wait_for_value(
+            page,
+            password_input,
+            _PASSWORD_ENTERED_JS,
+            "2FA password",
+            max_wait_time,
+            report_progress=self.interactive,
+        ):
+            raise LoginError("Timeout waiting for 2FA password input")
+
+        logger.info("2FA password entered")
+        return await password_input.input_value()
 
     async def handle_2fa(self, password: str) -> bool:
         """
@@ -547,49 +560,29 @@ class TelegramLogin:
             password: 2FA password
 
         Returns:
-            True if 2FA successful
+            True if 2FA successful and the login is confirmed
         """
-        page = self.browser.get_page()
+        page = self._get_page()
 
         # Find password input
-        password_selectors = [
-            'input[type="password"]',
-            'input[placeholder*="password" i]',
-            'input[placeholder*="Password" i]',
-        ]
-
-        password_input = None
-        for selector in password_selectors:
-            try:
-                password_input = await wait_for_selector(page, selector, timeout=5000)
-                break
-            except ElementNotFoundError:
-                continue
-
+        password_input = await _wait_for_any(self._visible(page, _PASSWORD_UNION), timeout=5000)
         if not password_input:
             logger.info("No 2FA password field found")
-            return True  # No 2FA required
+            return await self.check_login_success()  # No 2FA required
 
         # Enter password
-        await password_input.click()
-        await password_input.fill("")
-        await password_input.type(password, delay=100)
-        await page.wait_for_timeout(500)
+        await self._enter_text(password_input, password)
 
         # Submit
-        button_selectors = [
-            'button:has-text("Next")',
-            'button:has-text("Sign In")',
-            'button[type="submit"]',
-        ]
-
-        for selector in button_selectors:
-            try:
-                if await safe_click(page, selector, timeout=3000):
-                    break
-            except Exception:
-                continue
-
-        await page.wait_for_timeout(2000)
+        await _click_first(page, _PASSWORD_SUBMIT_SELECTORS, timeout=3000)
+
+        # Resolve as soon as either the logged-in UI or a password error shows up
+        if await _wait_for_any(self._visible(page, _PASSWORD_OUTCOME_UNION), timeout=10000):
+            if await self._visible(page, _LOGGED_IN_UNION).is_visible():
+                logger.info("Login success confirmed")
+                return True
+            logger.warning("2FA password was rejected")
+            return False
+
         return await self.check_login_success()
 
@@ -1,14 +1,112 @@
 """Notes management for tracking operations and findings."""
 
-import json
 import logging
-import uuid
+import re
+import secrets
+import sqlite3
+import threading
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_COLUMNS = "id, title, content, category, tags_json, priority, created_at, updated_at"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    category TEXT NOT NULL,
+    tags_json TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_category ON notes(category);
+CREATE INDEX IF NOT EXISTS notes_priority ON notes(priority);
+CREATE INDEX IF NOT EXISTS notes_created_at ON notes(created_at);
+"""
+
+# Inverted tag index, so tag filters are index lookups instead of a json_each() scan of
+# every row. tags_json stays the source of truth (it preserves order); triggers mirror it.
+_TAG_INDEX_SCHEMA = """
+CREATE TABLE note_tags (
+    tag TEXT NOT NULL,
+    note_id TEXT NOT NULL,
+    PRIMARY KEY (tag, note_id)
+) WITHOUT ROWID;
+CREATE INDEX note_tags_note_id ON note_tags(note_id);
+CREATE TRIGGER note_tags_insert AFTER INSERT ON notes BEGIN
+    INSERT OR IGNORE INTO note_tags(tag, note_id) SELECT value, new.id FROM json_each(new.tags_json);
+END;
+CREATE TRIGGER note_tags_delete AFTER DELETE ON notes BEGIN
+    DELETE FROM note_tags WHERE note_id = old.id;
+END;
+CREATE TRIGGER note_tags_update AFTER UPDATE OF tags_json ON notes BEGIN
+    DELETE FROM note_tags WHERE note_id = old.id;
+    INSERT OR IGNORE INTO note_tags(tag, note_id) SELECT value, new.id FROM json_each(new.tags_json);
+END;
+INSERT OR IGNORE INTO note_tags(tag, note_id)
+    SELECT value, notes.id FROM notes, json_each(notes.tags_json);
+"""
+
+# Full-text index over title/content, kept in sync by triggers. The trigram tokenizer
+# matches any substring of 3+ characters case-insensitively, like the old `in` search.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title, content, content='notes', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+    INSERT INTO notes_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    INSERT INTO notes_fts(notes_fts, rowid, title, content)
+    VALUES ('delete', old.rowid, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE OF title, content ON notes BEGIN
+    INSERT INTO notes_fts(notes_fts, rowid, title, content)
+    VALUES ('delete', old.rowid, old.title, old.content);
+    INSERT INTO notes_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+"""
+
+# Trigrams cannot match shorter search terms; those fall back to a scan with icontains().
+_FTS_MIN_SEARCH_LENGTH = 3
+
+
+def _dump_tags(tags: list[str]) -> str:
+    # SQLite's json_each() rejects BLOBs, so store the tags as TEXT
+    return orjson.dumps(tags).decode()
+
+
+def _row_to_note(row: tuple) -> dict[str, Any]:
+    note_id, title, content, category, tags_json, priority, created_at, updated_at = row
+    return {
+        "id": note_id,
+        "title": title,
+        "content": content,
+        "category": category,
+        "tags": orjson.loads(tags_json),
+        "priority": priority,
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+
+@lru_cache(maxsize=64)
+def _search_pattern(search: str) -> re.Pattern[str]:
+    return re.compile(re.escape(search), re.IGNORECASE)
+
+
+def _icontains(text: str, search: str) -> bool:
+    # Case-insensitive for all of Unicode, unlike SQLite's LIKE (ASCII only)
+    return _search_pattern(search).search(text) is not None
+
 
 class NotesManager:
     """Manages notes for operations and findings."""
@@ -23,28 +121,63 @@ class NotesManager:
         self.storage_path = storage_path or Path.cwd() / "notes"
         self.storage_path.mkdir(exist_ok=True)
 
+        self.db_file = self.storage_path / "notes.db"
+        # Pre-SQLite storage, imported once into the database
         self.notes_file = self.storage_path / "notes.json"
-        self._notes: dict[str, dict[str, Any]] = {}
-        self._load_notes()
 
-    def _load_notes(self) -> None:
-        """Load notes from file."""
-        if self.notes_file.exists():
-            try:
-                with open(self.notes_file, "r", encoding="utf-8") as f:
-                    self._notes = json.load(f)
-                logger.info(f"Loaded {len(self._notes)} notes")
-            except Exception as e:
-                logger.warning(f"Failed to load notes: {e}")
-                self._notes = {}
-
-    def _save_notes(self) -> None:
-        """Save notes to file."""
+        # Autocommit: every statement is its own transaction; WAL keeps writes cheap.
+        # The API calls in from worker threads (asyncio.to_thread); the lock keeps one
+        # statement and its cursor on the shared connection at a time.
+        self._db = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.create_function("icontains", 2, _icontains, deterministic=True)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        has_tag_index = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'note_tags'"
+        ).fetchone()
+        if not has_tag_index:
+            # Creates the index and backfills it from notes stored before it existed
+            self._db.executescript(f"BEGIN; {_TAG_INDEX_SCHEMA} COMMIT;")
+        try:
+            self._db.executescript(_FTS_SCHEMA)
+            self._fts = True
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5 or the trigram tokenizer (< 3.34)
+            logger.warning(f"Full-text search unavailable, scanning instead: {e}")
+            self._fts = False
+
+        self._migrate_json()
+
+    def _migrate_json(self) -> None:
+        """Import notes from the legacy notes.json, then rename it out of the way."""
+        if not self.notes_file.exists():
+            return
         try:
-            with open(self.notes_file, "w", encoding="utf-8") as f:
-                json.dump(self._notes, f, indent=2, default=str)
+            legacy = orjson.loads(self.notes_file.read_bytes())
+            rows = [
+                (
+                    note["id"],
+                    note.get("title", ""),
+                    note.get("content", ""),
+                    note.get("category", "general"),
+                    _dump_tags(note.get("tags", [])),
+                    note.get("priority", "normal"),
+                    note.get("created_at", ""),
+                    note.get("updated_at", ""),
+                )
+                for note in legacy.values()
+            ]
+            with self._db:
+                self._db.execute("BEGIN")
+                self._db.executemany(
+                    f"INSERT OR IGNORE INTO notes ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            self.notes_file.rename(self.notes_file.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(rows)} notes from {self.notes_file}")
         except Exception as e:
-            logger.error(f"Failed to save notes: {e}")
+            logger.warning(f"Failed to migrate notes: {e}")
 
     def create_note(
         self,
@@ -67,22 +200,30 @@ class NotesManager:
         Returns:
             Note ID
         """
-        note_id = str(uuid.uuid4())[:8]
         timestamp = datetime.now(UTC).isoformat()
-
-        note = {
-            "id": note_id,
-            "title": title.strip(),
-            "content": content.strip(),
-            "category": category,
-            "tags": tags or [],
-            "priority": priority,
-            "created_at": timestamp,
-            "updated_at": timestamp,
-        }
-
-        self._notes[note_id] = note
-        self._save_notes()
+        row = [
+            None,
+            title.strip(),
+            content.strip(),
+            category,
+            _dump_tags(tags or []),
+            priority,
+            timestamp,
+            timestamp,
+        ]
+
+        # 32-bit ids can collide once there are tens of thousands of notes; the primary
+        # key rejects a duplicate, so just draw again.
+        while True:
+            note_id = row[0] = secrets.token_hex(4)
+            try:
+                with self._lock:
+                    self._db.execute(
+                        f"INSERT INTO notes ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row
+                    )
+                break
+            except sqlite3.IntegrityError:
+                continue
 
         logger.info(f"Note created: {note_id} - {title}")
         return note_id
@@ -93,6 +234,8 @@ class NotesManager:
         tags: Optional[list[str]] = None,
         priority: Optional[str] = None,
         search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         """
         List notes with optional filtering.
@@ -102,35 +245,49 @@ class NotesManager:
             tags: Filter by tags
             priority: Filter by priority
             search: Search in title and content
+            limit: Maximum number of notes to return (default: all)
+            offset: Number of notes to skip, newest first
 
         Returns:
             List of notes
         """
-        filtered_notes = []
-
-        for note in self._notes.values():
-            if category and note.get("category") != category:
-                continue
-
-            if priority and note.get("priority") != priority:
-                continue
-
-            if tags:
-                note_tags = note.get("tags", [])
-                if not any(tag in note_tags for tag in tags):
-                    continue
-
-            if search:
-                search_lower = search.lower()
-                title_match = search_lower in note.get("title", "").lower()
-                content_match = search_lower in note.get("content", "").lower()
-                if not (title_match or content_match):
-                    continue
-
-            filtered_notes.append(note)
-
-        filtered_notes.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return filtered_notes
+        where: list[str] = []
+        params: list[Any] = []
+
+        if category:
+            where.append("category = ?")
+            params.append(category)
+
+        if priority:
+            where.append("priority = ?")
+            params.append(priority)
+
+        if tags:
+            # Any of the given tags
+            placeholders = ", ".join("?" * len(tags))
+            where.append(f"id IN (SELECT note_id FROM note_tags WHERE tag IN ({placeholders}))")
+            params.extend(tags)
+
+        if search:
+            if self._fts and len(search) >= _FTS_MIN_SEARCH_LENGTH:
+                where.append("rowid IN (SELECT rowid FROM notes_fts WHERE notes_fts MATCH ?)")
+                params.append('"' + search.replace('"', '""') + '"')
+            else:
+                where.append("(icontains(title, ?) OR icontains(content, ?))")
+                params.extend((search, search))
+
+        sql = f"SELECT {_COLUMNS} FROM notes"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        # Walks the created_at index and stops after the requested page
+        sql += " ORDER BY created_at DESC"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, offset))
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [_row_to_note(row) for row in rows]
 
     def update_note(
         self,
@@ -153,23 +310,25 @@ class NotesManager:
         Returns:
             True if updated successfully
         """
-        if note_id not in self._notes:
-            logger.warning(f"Note not found: {note_id}")
-            return False
-
-        note = self._notes[note_id]
-
+        changes: dict[str, Any] = {}
         if title is not None:
-            note["title"] = title.strip()
+            changes["title"] = title.strip()
         if content is not None:
-            note["content"] = content.strip()
+            changes["content"] = content.strip()
         if tags is not None:
-            note["tags"] = tags
+            changes["tags_json"] = _dump_tags(tags)
         if priority is not None:
-            note["priority"] = priority
-
-        note["updated_at"] = datetime.now(UTC).isoformat()
-        self._save_notes()
+            changes["priority"] = priority
+        changes["updated_at"] = datetime.now(UTC).isoformat()
+
+        assignments = ", ".join(f"{column} = ?" for column in changes)
+        with self._lock:
+            cursor = self._db.execute(
+                f"UPDATE notes SET {assignments} WHERE id = ?", (*changes.values(), note_id)
+            )
+        if not cursor.rowcount:
+            logger.warning(f"Note not found: {note_id}")
+            return False
 
         logger.info(f"Note updated: {note_id}")
         return True
@@ -184,13 +343,12 @@ class NotesManager:
         Returns:
             True if deleted successfully
         """
-        if note_id not in self._notes:
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        if not cursor.rowcount:
             logger.warning(f"Note not found: {note_id}")
             return False
 
-        del self._notes[note_id]
-        self._save_notes()
-
         logger.info(f"Note deleted: {note_id}")
         return True
 
@@ -204,5 +362,8 @@ class NotesManager:
         Returns:
             Note dictionary or None
         """
-        return self._notes.get(note_id)
-
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM notes WHERE id = ?", (note_id,)
+            ).fetchone()
+        return _row_to_note(row) if row else None
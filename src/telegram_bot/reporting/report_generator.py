@@ -1,13 +1,20 @@
 """Report generator for operations."""
 
-import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
+from ..telemetry.tracer import RUN_JSON_OPTIONS
+
 logger = logging.getLogger(__name__)
 
+# Markdown heading marker per operation status; anything else is still in progress
+_STATUS_EMOJI = {"completed": "✅", "failed": "❌"}
+_DEFAULT_EMOJI = "⏳"
+
 
 class ReportGenerator:
     """Generates reports for operations."""
@@ -43,8 +50,9 @@ class ReportGenerator:
         Returns:
             Path to generated report file
         """
-        timestamp = timestamp or datetime.now(UTC).isoformat()
-        report_id = f"{operation_type}_{operation_name}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now(UTC)
+        timestamp = timestamp or now.isoformat()
+        report_id = f"{operation_type}_{operation_name}_{now.strftime('%Y%m%d_%H%M%S')}"
 
         report = {
             "report_id": report_id,
@@ -56,10 +64,9 @@ class ReportGenerator:
         }
 
         report_file = self.output_dir / f"{report_id}.json"
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, default=str)
+        report_file.write_bytes(orjson.dumps(report, default=str, option=RUN_JSON_OPTIONS))
 
-        logger.info(f"Report generated: {report_file}")
+        logger.info("Report generated: %s", report_file)
         return report_file
 
     def generate_summary_report(
@@ -81,9 +88,10 @@ class ReportGenerator:
         Returns:
             Path to generated report file
         """
+        now = datetime.now(UTC)
         report = {
             "run_name": run_name,
-            "generated_at": datetime.now(UTC).isoformat(),
+            "generated_at": now.isoformat(),
             "statistics": statistics,
             "total_operations": len(operations),
             "total_errors": len(errors),
@@ -91,11 +99,10 @@ class ReportGenerator:
             "errors": errors,
         }
 
-        report_file = self.output_dir / f"summary_{run_name}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, default=str)
+        report_file = self.output_dir / f"summary_{run_name}_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        report_file.write_bytes(orjson.dumps(report, default=str, option=RUN_JSON_OPTIONS))
 
-        logger.info(f"Summary report generated: {report_file}")
+        logger.info("Summary report generated: %s", report_file)
         return report_file
 
     def generate_markdown_report(
@@ -117,10 +124,13 @@ class ReportGenerator:
         Returns:
             Path to generated markdown file
         """
-        md_content = f"""# Telegram Automation Report
+        now = datetime.now(UTC)
+        # Collected as parts and joined once; += on a growing str copies it every time
+        parts = [
+            f"""# Telegram Automation Report
 
 **Run Name:** {run_name}  
-**Generated At:** {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}
+**Generated At:** {now.strftime('%Y-%m-%d %H:%M:%S UTC')}
 
 ## Statistics
 
@@ -134,26 +144,29 @@ class ReportGenerator:
 ## Operations
 
 """
+        ]
         for op in operations:
-            status_emoji = "✅" if op.get("status") == "completed" else "❌" if op.get("status") == "failed" else "⏳"
-            md_content += f"### {status_emoji} {op.get('type', 'unknown')}.{op.get('name', 'unknown')}\n\n"
-            md_content += f"- **Status:** {op.get('status', 'unknown')}\n"
-            md_content += f"- **Timestamp:** {op.get('timestamp', 'unknown')}\n"
-            if op.get("error"):
-                md_content += f"- **Error:** {op.get('error')}\n"
-            md_content += "\n"
+            status = op.get("status", "unknown")
+            status_emoji = _STATUS_EMOJI.get(status, _DEFAULT_EMOJI)
+            parts.append(f"### {status_emoji} {op.get('type', 'unknown')}.{op.get('name', 'unknown')}\n\n")
+            parts.append(f"- **Status:** {status}\n")
+            parts.append(f"- **Timestamp:** {op.get('timestamp', 'unknown')}\n")
+            error = op.get("error")
+            if error:
+                parts.append(f"- **Error:** {error}\n")
+            parts.append("\n")
 
         if errors:
-            md_content += "## Errors\n\n"
+            parts.append("## Errors\n\n")
             for error in errors:
-                md_content += f"### ❌ {error.get('type', 'unknown')}.{error.get('name', 'unknown')}\n\n"
-                md_content += f"- **Error:** {error.get('error', 'Unknown error')}\n"
-                md_content += f"- **Timestamp:** {error.get('timestamp', 'unknown')}\n\n"
+                parts.append(f"### ❌ {error.get('type', 'unknown')}.{error.get('name', 'unknown')}\n\n")
+                parts.append(f"- **Error:** {error.get('error', 'Unknown error')}\n")
+                parts.append(f"- **Timestamp:** {error.get('timestamp', 'unknown')}\n\n")
 
-        report_file = self.output_dir / f"report_{run_name}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.md"
+        report_file = self.output_dir / f"report_{run_name}_{now.strftime('%Y%m%d_%H%M%S')}.md"
         with open(report_file, "w", encoding="utf-8") as f:
-            f.write(md_content)
+            f.write("".join(parts))
 
-        logger.info(f"Markdown report generated: {report_file}")
+        logger.info("Markdown report generated: %s", report_file)
         return report_file
 
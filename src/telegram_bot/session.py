@@ -1,13 +1,25 @@
 """Session management for Telegram automation."""
 
-import json
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Characters dropped from a phone number to build its session filename
+_PHONE_STRIP = re.compile(r"[+\- ]")
+
+
+@lru_cache(maxsize=1024)
+def _safe_phone(phone: str) -> str:
+    """Sanitize a phone number for use in a filename."""
+    return _PHONE_STRIP.sub("", phone)
+
 
 class SessionManager:
     """Manages session storage for Telegram Web."""
@@ -21,6 +33,8 @@ class SessionManager:
         """
         self.sessions_dir = Path(sessions_dir)
         self.sessions_dir.mkdir(exist_ok=True)
+        # Parsed sessions keyed by path, validated against the file's mtime on every load.
+        self._cache: dict[Path, tuple[int, dict[str, Any]]] = {}
 
     def _get_session_path(self, phone: str) -> Path:
         """
@@ -32,9 +46,7 @@ class SessionManager:
         Returns:
             Path to session file
         """
-        # Sanitize phone number for filename
-        safe_phone = phone.replace("+", "").replace("-", "").replace(" ", "")
-        return self.sessions_dir / f"session_{safe_phone}.json"
+        return self.sessions_dir / f"session_{_safe_phone(phone)}.json"
 
     def save_session(
         self, phone: str, storage_state: dict[str, Any], metadata: Optional[dict] = None
@@ -54,12 +66,17 @@ class SessionManager:
             "metadata": metadata or {},
         }
 
+        # Written aside and swapped in: a crash mid-write must not leave a truncated session
+        # behind, and the dot-prefixed temp file never matches list_sessions()'s glob.
+        tmp_path = session_path.with_name(f".{session_path.name}.tmp")
+        self._cache.pop(session_path, None)
         try:
-            with open(session_path, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2)
-            logger.info(f"Session saved for {phone}")
+            tmp_path.write_bytes(orjson.dumps(session_data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, session_path)
+            logger.info("Session saved for %s", phone)
         except Exception as e:
-            logger.error(f"Failed to save session: {e}")
+            tmp_path.unlink(missing_ok=True)
+            logger.error("Failed to save session: %s", e)
             raise
 
     def load_session(self, phone: str) -> Optional[dict[str, Any]]:
@@ -74,17 +91,24 @@ class SessionManager:
         """
         session_path = self._get_session_path(phone)
 
-        if not session_path.exists():
-            logger.info(f"No saved session found for {phone}")
+        try:
+            mtime = session_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cache.pop(session_path, None)
+            logger.info("No saved session found for %s", phone)
             return None
 
+        cached = self._cache.get(session_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
         try:
-            with open(session_path, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
-            logger.info(f"Session loaded for {phone}")
+            session_data = orjson.loads(session_path.read_bytes())
+            self._cache[session_path] = (mtime, session_data)
+            logger.info("Session loaded for %s", phone)
             return session_data
         except Exception as e:
-            logger.error(f"Failed to load session: {e}")
+            logger.error("Failed to load session: %s", e)
             return None
 
     def session_exists(self, phone: str) -> bool:
@@ -113,32 +137,27 @@ class SessionManager:
         session_path = self._get_session_path(phone)
 
         if not session_path.exists():
-            logger.info(f"No session to delete for {phone}")
+            logger.info("No session to delete for %s", phone)
             return False
 
+        self._cache.pop(session_path, None)
         try:
             session_path.unlink()
-            logger.info(f"Session deleted for {phone}")
+            logger.info("Session deleted for %s", phone)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete session: {e}")
+            logger.error("Failed to delete session: %s", e)
             return False
 
     def list_sessions(self) -> list[str]:
         """
         List all saved sessions.
 
+        Phones are recovered from the filenames, so no session file is opened; they are
+        returned normalized (e.g. "+84123456789"), which maps back to the same file.
+
         Returns:
             List of phone numbers with saved sessions
         """
-        sessions = []
-        for session_file in self.sessions_dir.glob("session_*.json"):
-            try:
-                with open(session_file, "r", encoding="utf-8") as f:
-                    session_data = json.load(f)
-                    if "phone" in session_data:
-                        sessions.append(session_data["phone"])
-            except Exception as e:
-                logger.warning(f"Failed to read session file {session_file}: {e}")
-        return sessions
-
+        prefix = len("session_")
+        return ["+" + path.stem[prefix:] for path in self.sessions_dir.glob("session_*.json")]
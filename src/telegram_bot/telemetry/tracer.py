@@ -1,16 +1,46 @@
-"""Tracer for tracking operations and generating reports."""
+"""Tracer for tracking operations and generating reports.
 
-import json
+While a run is in progress its operations are appended, in batches, to
+`operations.ndjson` in the run directory (one JSON object per line), and each batch also
+refreshes the small `stats.json` summary; a live run is read by streaming the former.
+The full `run_data.json` snapshot is written by `finish()`.
+"""
+
+import itertools
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Indented for readability; details may carry non-str keys and arbitrary objects (default=str).
+# Shared with the report generator, which writes the same run data.
+RUN_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Buffered operations are appended to operations.ndjson in batches of this size
+_FLUSH_EVERY = 10
+
+# Statistic counted for each completed operation of these types
+_COMPLETED_STAT = {
+    "login": "login_attempts",
+    "contact": "contacts_added",
+    "group": "groups_created",
+}
+
 _global_tracer: Optional["Tracer"] = None
 
 
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write aside and swap in, so readers never see a half-written file."""
+    tmp_file = path.with_name(f".{path.name}.tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, path)
+
+
 def get_global_tracer() -> Optional["Tracer"]:
     """Get global tracer instance."""
     return _global_tracer
@@ -32,13 +62,13 @@ class Tracer:
         Args:
             run_name: Name for this run
         """
-        self.run_name = run_name or f"run-{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now(UTC)
+        self.run_name = run_name or f"run-{now.strftime('%Y%m%d_%H%M%S')}"
         self.run_id = self.run_name
-        self.start_time = datetime.now(UTC).isoformat()
+        self.start_time = now.isoformat()
         self.end_time: Optional[str] = None
 
         self.operations: list[dict[str, Any]] = []
-        self.errors: list[dict[str, Any]] = []
         self.statistics: dict[str, Any] = {
             "total_operations": 0,
             "successful_operations": 0,
@@ -49,16 +79,36 @@ class Tracer:
         }
 
         self._run_dir: Optional[Path] = None
-        self._next_operation_id = 1
+        self._next_operation_id = itertools.count(1).__next__
+        # Serialized operations not yet appended to operations.ndjson
+        self._pending: list[bytes] = []
+
+    @property
+    def errors(self) -> list[dict[str, Any]]:
+        """Failed operations, derived from `operations` rather than stored twice."""
+        return [op for op in self.operations if op["status"] == "failed"]
 
     def get_run_dir(self) -> Path:
-        """Get or create run directory."""
+        """
+        Get or create run directory.
+
+        The directory is claimed on first use. If one already exists for `run_name` (a
+        reused name, or two runs started in the same second), a numeric suffix is added
+        and `run_name` updated, so runs never append to or overwrite each other's files.
+        """
         if self._run_dir is None:
             runs_dir = Path.cwd() / "telegram_runs"
             runs_dir.mkdir(exist_ok=True)
 
+            base_name = self.run_name
+            for suffix in itertools.count(2):
+                try:
+                    (runs_dir / self.run_name).mkdir()
+                    break
+                except FileExistsError:
+                    self.run_name = f"{base_name}-{suffix}"
+            self.run_id = self.run_name
             self._run_dir = runs_dir / self.run_name
-            self._run_dir.mkdir(exist_ok=True)
 
         return self._run_dir
 
@@ -83,8 +133,7 @@ class Tracer:
         Returns:
             Operation ID
         """
-        operation_id = self._next_operation_id
-        self._next_operation_id += 1
+        operation_id = self._next_operation_id()
 
         operation = {
             "id": operation_id,
@@ -99,24 +148,24 @@ class Tracer:
         self.operations.append(operation)
 
         # Update statistics
-        self.statistics["total_operations"] += 1
+        stats = self.statistics
+        stats["total_operations"] += 1
         if status == "completed":
-            self.statistics["successful_operations"] += 1
-            if operation_type == "login":
-                self.statistics["login_attempts"] += 1
-            elif operation_type == "contact":
-                self.statistics["contacts_added"] += 1
-            elif operation_type == "group":
-                self.statistics["groups_created"] += 1
+            stats["successful_operations"] += 1
+            stat = _COMPLETED_STAT.get(operation_type)
+            if stat is not None:
+                stats[stat] += 1
         elif status == "failed":
-            self.statistics["failed_operations"] += 1
-            self.errors.append(operation)
+            stats["failed_operations"] += 1
 
-        logger.info(f"Operation logged: {operation_type}.{operation_name} - {status}")
+        logger.info("Operation logged: %s.%s - %s", operation_type, operation_name, status)
 
-        # Auto-save periodically
-        if len(self.operations) % 10 == 0:
-            self.save_run_data()
+        # Append in batches instead of rewriting the whole run every few operations
+        self._pending.append(
+            orjson.dumps(operation, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        )
+        if len(self._pending) >= _FLUSH_EVERY:
+            self.flush_operations()
 
         return operation_id
 
@@ -131,6 +180,21 @@ class Tracer:
         """
         self.log_operation(operation_type, operation_name, status="failed", error=error)
 
+    def flush_operations(self) -> None:
+        """Append buffered operations to operations.ndjson and refresh stats.json."""
+        if not self._pending:
+            return
+
+        run_dir = self.get_run_dir()
+        ops_file = run_dir / "operations.ndjson"
+        with open(ops_file, "ab") as f:
+            f.write(b"".join(self._pending))
+        self._pending.clear()
+        # History lives in the log; only the counters are rewritten
+        _write_atomic(run_dir / "stats.json", orjson.dumps(self.get_summary()))
+
+        logger.debug("Operations appended to %s", ops_file)
+
     def save_run_data(self) -> None:
         """Save run data to file."""
         run_dir = self.get_run_dir()
@@ -145,18 +209,19 @@ class Tracer:
             "errors": self.errors,
         }
 
+        # Swapped in atomically, so GET /runs/{name} never reads a half-written file
         run_file = run_dir / "run_data.json"
-        with open(run_file, "w", encoding="utf-8") as f:
-            json.dump(run_data, f, indent=2, default=str)
+        _write_atomic(run_file, orjson.dumps(run_data, default=str, option=RUN_JSON_OPTIONS))
 
-        logger.debug(f"Run data saved to {run_file}")
+        logger.debug("Run data saved to %s", run_file)
 
     def finish(self) -> None:
         """Finish tracing and save final data."""
         self.end_time = datetime.now(UTC).isoformat()
+        self.flush_operations()
         self.save_run_data()
 
-        logger.info(f"Tracer finished: {self.run_name}")
+        logger.info("Tracer finished: %s", self.run_name)
 
     def get_summary(self) -> dict[str, Any]:
         """Get summary of operations."""
@@ -166,6 +231,6 @@ class Tracer:
             "end_time": self.end_time,
             "statistics": self.statistics,
             "total_operations": len(self.operations),
-            "total_errors": len(self.errors),
+            "total_errors": self.statistics["failed_operations"],
         }
 
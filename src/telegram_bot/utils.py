@@ -4,13 +4,15 @@ import asyncio
 import logging
 import re
 import time
-from functools import wraps
-from typing import Any, Callable
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional, Sequence
 
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+_NON_PHONE_CHARS = re.compile(r"[^\d+]")
+
 
 class ElementNotFoundError(Exception):
     """Raised when an element is not found on the page."""
@@ -48,45 +50,149 @@ async def wait_for_selector(
     Raises:
         ElementNotFoundError: If element is not found within timeout
     """
+    state = "visible" if visible else "attached"
     try:
-        if visible:
-            element = await page.wait_for_selector(selector, timeout=timeout, state="visible")
-        else:
-            element = await page.wait_for_selector(selector, timeout=timeout)
-        return element
+        return await page.wait_for_selector(selector, timeout=timeout, state=state)
     except PlaywrightTimeoutError as e:
         logger.error(f"Element not found: {selector}")
         raise ElementNotFoundError(f"Element not found: {selector}") from e
 
 
-async def safe_click(page: Page, selector: str, timeout: int = 30000, retries: int = 3) -> bool:
+# First selector (in list order) matching an element, optionally requiring it to be rendered.
+# Invalid CSS (e.g. Playwright-only :has-text) throws in querySelector and is skipped.
+_FIRST_MATCH_JS = """({ selectors, visible }) => {
+    for (const s of selectors) {
+        let el = null;
+        try { el = document.querySelector(s); } catch (e) { continue; }
+        if (el && (!visible || el.getClientRects().length > 0)) return s;
+    }
+    return null;
+}"""
+
+
+async def first_matching_selector(page: Page, selectors: Sequence[str]) -> Optional[str]:
+    """
+    Return the first of `selectors` that currently matches an element.
+
+    All candidates are checked inside the page in a single round-trip.
+
+    Args:
+        page: Playwright page object
+        selectors: Plain CSS selectors, in priority order
+
+    Returns:
+        The matching selector, or None if none match
+    """
+    return await page.evaluate(_FIRST_MATCH_JS, {"selectors": list(selectors), "visible": False})
+
+
+async def wait_for_any_selector(
+    page: Page, selectors: Sequence[str], timeout: int = 30000
+) -> tuple[str, Any]:
+    """
+    Wait until any of `selectors` is visible and return the first one that is.
+
+    The candidates are polled inside the page, so the wait is bounded by a single
+    `timeout` instead of one timeout per selector.
+
+    Args:
+        page: Playwright page object
+        selectors: Plain CSS selectors, in priority order
+        timeout: Maximum time to wait in milliseconds
+
+    Returns:
+        Tuple of the matching selector and its ElementHandle
+
+    Raises:
+        ElementNotFoundError: If no selector matches within timeout
+    """
+    try:
+        handle = await page.wait_for_function(
+            _FIRST_MATCH_JS, arg={"selectors": list(selectors), "visible": True}, timeout=timeout
+        )
+    except PlaywrightTimeoutError as e:
+        # Not logged here: callers often use this as an optional wait.
+        raise ElementNotFoundError(f"None of the selectors found: {list(selectors)}") from e
+    selector = await handle.json_value()
+    return selector, await wait_for_selector(page, selector, timeout=timeout)
+
+
+async def race_selectors(
+    page: Page, selectors: Sequence[str], timeout: int = 30000
+) -> tuple[str, Any]:
+    """
+    Wait for all of `selectors` concurrently and return the first that becomes visible.
+
+    Unlike wait_for_any_selector, this accepts Playwright-only selectors (`:has-text`,
+    `text=`). Losing waits are cancelled; list order breaks ties.
+
+    Args:
+        page: Playwright page object
+        selectors: Selectors to race, in priority order
+        timeout: Maximum time to wait in milliseconds
+
+    Returns:
+        Tuple of the winning selector and its ElementHandle
+
+    Raises:
+        ElementNotFoundError: If no selector matches within timeout
+    """
+    tasks = {
+        asyncio.create_task(page.wait_for_selector(s, timeout=timeout, state="visible")): i
+        for i, s in enumerate(selectors)
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.__getitem__):
+                if not task.exception() and task.result() is not None:
+                    return selectors[tasks[task]], task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    raise ElementNotFoundError(f"None of the selectors found: {list(selectors)}")
+
+
+async def safe_click(
+    page: Page, selector: str, timeout: int = 30000, retries: int = 3, settle_ms: int = 0
+) -> bool:
     """
     Safely click an element with retry logic.
 
+    Only timeouts are retried; other Playwright errors (e.g. a malformed selector)
+    propagate immediately.
+
     Args:
         page: Playwright page object
         selector: CSS selector or text selector
-        timeout: Maximum time to wait in milliseconds
+        timeout: Maximum time to wait in milliseconds, split across the attempts
         retries: Number of retry attempts
+        settle_ms: Milliseconds to wait after the click (default: return immediately)
 
     Returns:
         True if click was successful
     """
+    attempt_timeout = max(timeout // retries, 1)
     for attempt in range(retries):
         try:
-            element = await wait_for_selector(page, selector, timeout=timeout)
+            element = await wait_for_selector(page, selector, timeout=attempt_timeout)
             await element.click()
-            await page.wait_for_timeout(500)  # Small delay after click
+            if settle_ms:
+                await page.wait_for_timeout(settle_ms)
             return True
         except (ElementNotFoundError, PlaywrightTimeoutError) as e:
             if attempt == retries - 1:
                 logger.error(f"Failed to click element after {retries} attempts: {selector}")
                 raise
             logger.warning(f"Click attempt {attempt + 1} failed, retrying...")
-            await page.wait_for_timeout(1000)
+            # Exponential backoff: 200 ms, 400 ms, ... capped at 2 s
+            await page.wait_for_timeout(min(200 * 2**attempt, 2000))
     return False
 
 
+@lru_cache(maxsize=4096)
 def extract_phone_number(phone: str) -> str:
     """
     Extract and format phone number.
@@ -98,7 +204,7 @@ def extract_phone_number(phone: str) -> str:
         Formatted phone number with country code
     """
     # Remove all non-digit characters except +
-    cleaned = re.sub(r"[^\d+]", "", phone)
+    cleaned = _NON_PHONE_CHARS.sub("", phone)
 
     # Ensure it starts with +
     if not cleaned.startswith("+"):
@@ -113,46 +219,46 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
 
     Args:
         max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Delay before the first retry in seconds, doubled after each further failure
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-            for attempt in range(max_retries):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
+        # Only the wrapper matching `func` is built. All but the last attempt retry on
+        # failure; the last one runs outside the loop and lets its exception propagate.
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(max_retries - 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception:
                         logger.warning(
                             f"Attempt {attempt + 1} failed for {func.__name__}, retrying..."
                         )
-                        await asyncio.sleep(delay)
-                    else:
-                        logger.error(f"All {max_retries} attempts failed for {func.__name__}")
-            raise last_exception
+                        await asyncio.sleep(delay * 2**attempt)
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    logger.error(f"All {max_retries} attempts failed for {func.__name__}")
+                    raise
+
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-            for attempt in range(max_retries):
+            for attempt in range(max_retries - 1):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1} failed for {func.__name__}, retrying..."
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(f"All {max_retries} attempts failed for {func.__name__}")
-            raise last_exception
+                except Exception:
+                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}, retrying...")
+                    time.sleep(delay * 2**attempt)
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                logger.error(f"All {max_retries} attempts failed for {func.__name__}")
+                raise
 
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator